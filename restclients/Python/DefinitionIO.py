@@ -122,7 +122,10 @@ class DefinitionWriter:
         # It's important that we re-order that definitions so that we define dependent gates
         # Before they are needed:
         
-        defs = self._fill_missing_condition_keys(defs)
+        # Those add keys to the definitions; copy them as they may be the
+        # client's cached list.
+
+        defs = self._fill_missing_condition_keys([dict(d) for d in defs])
         defs = self._reorder_conditions(defs)
         
         c = self._sqlite.cursor()
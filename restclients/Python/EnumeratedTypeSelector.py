@@ -32,6 +32,23 @@ class TypeSelector(QComboBox):
     '''
     def addItem(self, text, value):
         super().addItem(text, value)
+    '''
+       Add several types at once from an iterable of (text, value)
+       pairs.  Rather than a selection signal as the first item goes
+       in, there's at most one when all items have been added.
+       e.g. box.addTypes([('1-d', SpectrumTypes.Oned), ('2-d', SpectrumTypes.Twod)])
+    '''
+    def addTypes(self, items):
+        before = after = self.currentIndex()
+        blocked = self.blockSignals(True)
+        try:
+            for text, value in items:
+                super().addItem(text, value)
+            after = self.currentIndex()
+            self.setCurrentIndex(before)    # So Qt sees any change below.
+        finally:
+            self.blockSignals(blocked)
+        self.setCurrentIndex(after)
 
     def select_type(self, index):
         sptype = self.currentData()
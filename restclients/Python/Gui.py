@@ -154,6 +154,7 @@ parsed_args.add_argument('-p', '--port',
 )
 parsed_args.add_argument('-s', '--service', default=None, action='store', help='Service the REST server advertises defaults to None')
 parsed_args.add_argument('-u', '--service-user', default=OsServices.getlogin(), action='store', help=f'Username the REST server advertises under defaults to "{OsServices.getlogin()}"')
+parsed_args.add_argument('--set-workers', default=None, type=int, action='store', help='Number of tree variables set at once; 1 sets them one at a time in order. Defaults to 4')
 
 args = parsed_args.parse_args()
 
@@ -162,6 +163,8 @@ print(client_args)
 if args.service is not None:
     client_args['service'] = args.service
     client_args['user']    = args.service_user
+if args.set_workers is not None:
+    client_args['set_workers'] = args.set_workers
     
 
 client = RestClient(client_args)
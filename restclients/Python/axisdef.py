@@ -50,12 +50,14 @@ class AxisInput(QFrame):
        lowChanged - the low limit changed.
        highChanged- the high limit changed.
        binsCHanged- the bins selected changed.
+       axisChanged- setAxis set all three (passes low, high, bins).
 
     '''
 
     lowChanged = pyqtSignal(float)
     highChanged = pyqtSignal(float)
     binsChanged = pyqtSignal(int)
+    axisChanged = pyqtSignal(float, float, int)
 
     def __init__(self, *args):
         global _lowModel
@@ -112,6 +114,16 @@ class AxisInput(QFrame):
         return int(self.bins_value.currentText())
     def setBins(self, value):
         self.bins_value.setCurrentText("{}".format(value))
+
+    def setAxis(self, low, high, bins):
+        # Set the whole axis with one axisChanged signal rather than
+        # a signal per value.
+        blocked = self.blockSignals(True)
+        self.setLow(low)
+        self.setHigh(high)
+        self.setBins(bins)
+        self.blockSignals(blocked)
+        self.axisChanged.emit(self.low(), self.high(), self.bins())
     
 #  Testing:
 
@@ -129,6 +129,7 @@ class oneDEditor(QWidget):
         self.axis.lowChanged.connect(self.axisChanged)
         self.axis.highChanged.connect(self.axisChanged)
         self.axis.binsChanged.connect(self.axisChanged)
+        self.axis.axisChanged.connect(self.axisChanged)
         c.pressed.connect(self.make_spectrum)
 
     # Attribute getter/setter methods.
@@ -157,6 +158,9 @@ class oneDEditor(QWidget):
         return self.axis.bins()
     def setBins(self, value):
         self.axis.setBins(value)
+    def setAxis(self, low, high, bins):
+        # One axisModified rather than one per value.
+        self.axis.setAxis(low, high, bins)
 
     def array(self):
         return self.is_array.checkState() == Qt.Checked
@@ -177,6 +177,10 @@ class Gamma2DEditor(QWidget):
         return self._yaxis.bins()
     def setYbins(self, value):
         self._yaxis.setBins(value)
+
+    def setAxes(self, xlow, xhigh, xbins, ylow, yhigh, ybins):
+        self._xaxis.setAxis(xlow, xhigh, xbins)
+        self._yaxis.setAxis(ylow, yhigh, ybins)
         
     # For compatibility:
     
@@ -87,6 +87,8 @@ class _Axis(QWidget):
         return self._axis.bins()
     def setBins(self, value):
         self._axis.setBins(value)
+    def setAxis(self, low, high, bins):
+        self._axis.setAxis(low, high, bins)
     
 
 
@@ -239,6 +241,10 @@ class GammaDeluxeEditor(QWidget):
     def setYbins(self, value):
         self._yaxis.setBins(value)
 
+    def setAxes(self, xlow, xhigh, xbins, ylow, yhigh, ybins):
+        self._xaxis.setAxis(xlow, xhigh, xbins)
+        self._yaxis.setAxis(ylow, yhigh, ybins)
+
 
 
 # test code
@@ -358,6 +358,8 @@ class GammaSummaryEditor(QWidget):
         return self._axis.bins()
     def setBins(self, bins):
         self._axis.setBins(bins)
+    def setAxis(self, low, high, bins):
+        self._axis.setAxis(low, high, bins)
     
     def array(self):
         return self._checkState(self._array)
@@ -123,6 +123,8 @@ class StripChartEditor(QWidget):
         return self._axis.bins()
     def setBins(self, value):
         self._axis.setBins(value)
+    def setAxis(self, low, high, bins):
+        self._axis.setAxis(low, high, bins)
 
 #-----------------------  test code ---------------------------------
 
@@ -170,6 +170,8 @@ class SummaryEditor(QWidget):
         return self._axis.bins()
     def setBins(self, value):
         self._axis.setBins(value)
+    def setAxis(self, low, high, bins):
+        self._axis.setAxis(low, high, bins)
 
     def array(self):
         return self._list.array()
@@ -52,6 +52,7 @@ class _AxisWidget(QWidget):
         self._axis_spec.lowChanged.connect(self._axisChanged)
         self._axis_spec.highChanged.connect(self._axisChanged)
         self._axis_spec.binsChanged.connect(self._axisChanged)
+        self._axis_spec.axisChanged.connect(self._axisChanged)
 
     #  Internal slots.
 
@@ -87,6 +88,9 @@ class _AxisWidget(QWidget):
         return self._axis_spec.bins()
     def setBins(self, value):
         self._axis_spec.setBins(value)
+    def setAxis(self, low, high, bins):
+        # One axisModified rather than one per value.
+        self._axis_spec.setAxis(low, high, bins)
 
 class TwoDEditor(QWidget):
     '''
@@ -206,6 +210,8 @@ class TwoDEditor(QWidget):
         return self._xaxis.bins()
     def setXBins(self, value):
         self._xaxis.setBins(value)
+    def setXAxis(self, low, high, bins):
+        self._xaxis.setAxis(low, high, bins)
     def ylow(self):
         return self._yaxis.low()
     def setYLow(self, value):
@@ -218,6 +224,8 @@ class TwoDEditor(QWidget):
         return self._yaxis.bins()
     def setYBins(self, value):
         self._yaxis.setBins(value)
+    def setYAxis(self, low, high, bins):
+        self._yaxis.setAxis(low, high, bins)
     
         
 
@@ -3,6 +3,7 @@
    provide so-called business logic for the editor, that connects it to 
    actions requested of the server.
 '''
+import copy
 import ParameterChooser
 import parameditor
 import spectrumeditor
@@ -133,7 +134,10 @@ class ParameterController:
         # get it for each parameter. Note the spectrum model could be filtered
         # so we can't use it:
 
-        self._spectrum_defs = self._client.spectrum_list('*')['detail']
+        # The axes are modified in place so copy what may be the client's
+        # cached list.
+
+        self._spectrum_defs = copy.deepcopy(self._client.spectrum_list('*')['detail'])
 
         # Given the Change button was clicked, this returns a list of dicts.
         # Each dict contains: a modified specrum definition for that spectrum.
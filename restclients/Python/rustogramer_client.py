@@ -5,10 +5,22 @@ object and then invoke methods on th at object to communicate
 with a running rustogramer program.  
 """
 
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import PortManager
 import OsServices
 
+# orjson decodes the large list responses much faster if it's installed.
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 class RustogramerException(Exception):
     """Exception type raised if the server replies with an error JSON
     
@@ -31,7 +43,17 @@ class rustogramer:
 
         Methods of the rustogramer class communicate with the server
         via the REST interface the server exports. 
+
+        Results of the parameter, spectrum, condition and tree variable
+        list requests are cached for cache_ttl seconds.  Any other request flushes the
+        cache as it may change what those lists would return.  Cached results
+        are shared, not copied; callers must copy anything they want to modify.
     """
+    cache_ttl = 2.0
+    set_workers = 4
+    _cached_requests = frozenset(
+        ('parameter/list', 'spectrum/list', 'gate/list', 'treevariable/list')
+    )
 
     def _service_port(self, host, port, name, user=None):
         #  Translate the service 'name' using the port manager on
@@ -49,18 +71,56 @@ class rustogramer:
         # perform a transaction returning the JSON on success.
         # On failures an exception is raised.
         
+        # Satisfy list requests from the cache if we can.  What's cached is
+        # returned as is, so callers must not modify it.  Requests are made
+        # from pool threads too so the cache is only touched with
+        # _cache_lock held.
+        #   Other requests flush the cache before and after they're made.
+        # Flushing bumps _cache_generation; a list fetched while that
+        # happened may predate the change so it's not cached.
+
+        if request not in self._cached_requests:
+            self.invalidate_cache()
+            try:
+                return self._request(request, queryparams)
+            finally:
+                self.invalidate_cache()
+
+        key = (request, tuple(sorted(queryparams.items())))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            generation = self._cache_generation
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        result = self._request(request, queryparams)
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = (time.monotonic(), result)
+        return result
+
+    def _request(self, request, queryparams):
+        # Make the request itself, returning the decoded JSON.
+
         # Create the URI:
 
         uri = "http://" + self.host + ":" + str(self.port) + "/spectcl/" + request
         if self.debug:
             print(uri, queryparams)
-        response = requests.get(uri, params=queryparams)
+        response = self._session.get(uri, params=queryparams)
         response.raise_for_status()     # Report response errors.and
-        result = response.json()
+        result = _json_loads(response.content)
         if result["status"] != "OK":
             raise RustogramerException(result)
         return result
 
+    def invalidate_cache(self):
+        """ Forget cached list results e.g. if something other than this
+        client may have changed them.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+
     def _marshall(self, iterable, key):
         return [x[key] for x in iterable]
 
@@ -95,13 +155,30 @@ class rustogramer:
         the port manager listener port and this parameter is the service name
         the rustogramer is advrtising for the current user.  This is translated
         to a port once.
+        *   'pooled_connections' (optional) - If False, each request makes
+        its own connection rather than reusing a kept-alive one.  Defaults
+        to True.
+        *   'cache_ttl' (optional) - Seconds list results are cached.  0
+        disables caching.  Defaults to rustogramer.cache_ttl.
+        *   'set_workers' (optional) - How many of the sets
+        treevariable_set_list makes at once.  1 makes them one at a time
+        in order.  Defaults to rustogramer.set_workers.
 
         The constructor makes no actual connection to the rustogramer
         REST interface.  This connection by each service request to that
-        port.
+        port.  Unless pooled_connections is False, requests share a session so
+        that, once made, the connection is kept alive and reused by
+        subsequent requests.
         """
         self.port = connection["port"]
         self.host = connection["host"]
+        self._cache = dict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        if 'cache_ttl' in connection:
+            self.cache_ttl = connection['cache_ttl']
+        if 'set_workers' in connection:
+            self.set_workers = connection['set_workers']
         if 'user' in connection.keys():
             user = connection['user']
         else:
@@ -110,6 +187,25 @@ class rustogramer:
             self.port = self._service_port(
                 connection['host'], connection['pmanport'],  connection["service"], user
             )
+        if connection.get('pooled_connections', True):
+            # A kept-alive connection the server has since closed fails
+            # the next request made on it so allow one retry on a new
+            # connection.  urllib3 already drops pooled connections it
+            # sees were closed before reusing them.  Read failures are not
+            # retried: many requests that change things (e.g.
+            # spectrum/create, spectrum/delete) are GETs, and the server
+            # may already have done them.
+
+            self._session = requests.Session()
+            self._session.mount(
+                'http://', HTTPAdapter(
+                    pool_connections=4, pool_maxsize=16,
+                    max_retries=Retry(total=1, connect=1, read=0, redirect=0, status=0)
+                )
+            )
+            self._session.headers['Connection'] = 'keep-alive'
+        else:
+            self._session = requests    # Module level get connects each time.
 
     #--------------- Gate application domains: /apply, /ungate
 
@@ -803,7 +899,8 @@ class rustogramer:
             if "xaxis" not in spectrum:
                 if spectrum['type'] == 'gs' or spectrum['type'] == 's' :  # s/Gs spectra, the axis is the y axis:
                     spectrum['xaxis'] = None
-                    spectrum ['yaxis'] = spectrum['axes'][0]
+                    # A copy so the cached axes keep the bins SpecTcl gave:
+                    spectrum ['yaxis'] = dict(spectrum['axes'][0])
                     if spectrum['type'] == 'gs':     # GS has bins including the over/underflows....
                         spectrum['yaxis']['bins'] -= 2  
                     pass
@@ -859,6 +956,25 @@ class rustogramer:
     def spectrum_delete(self, name):
         """ Delete the named spectrum"""
         return self._transaction("spectrum/delete", {"name":name})
+
+    def spectrum_delete_list(self, names):
+        """ Delete several spectra:
+        *   names - the names of the spectra to delete.
+
+        A failure to delete one spectrum does not stop the others from
+        being deleted.  The return value is a list with an element for
+        each name; None if it was deleted or the RustogramerException
+        that explains why not.
+        """
+        results = []
+        for name in names:
+            try:
+                self._transaction("spectrum/delete", {"name":name})
+            except RustogramerException as e:
+                results.append(e)
+            else:
+                results.append(None)
+        return results
     
     def spectrum_create1d(self, name, parameter, low, high, bins, chantype='f64'):
         """ Create a simple 1d spectrum:
@@ -872,6 +988,31 @@ class rustogramer:
             {"name":name, "type":"1", "parameters": parameter, "axes":axis, 'chantype':chantype}
         )
 
+    def spectrum_create1d_array(self, names, parameters, low, high, bins, chantype='f64'):
+        """ Create a set of simple 1d spectra with the same axis:
+        *   names - The names of the new spectra.
+        *   parameters - The parameter each of those spectra histograms.
+        *   low, high, bins - definition of the histograms' X axis.
+
+        Spectra are created in order stopping at the first failure.  The
+        return value is a list with an element for each spectrum creation
+        attempted; None if it was created or the RustogramerException
+        that explains why not.
+        """
+        axis = self._format_axis(low, high, bins)
+        results = []
+        for name, parameter in zip(names, parameters):
+            try:
+                self._transaction(
+                    "spectrum/create",
+                    {"name":name, "type":"1", "parameters": parameter, "axes":axis, 'chantype':chantype}
+                )
+            except RustogramerException as e:
+                results.append(e)
+                break
+            results.append(None)
+        return results
+
     def spectrum_create2d(self, name, xparam, yparam, xlow, xhigh, xbins, ylow, yhigh, ybins, chantype='f64'):
         """ Create a simple 2d spectrum:
         *  name - the name of the new spectrum.
@@ -1383,6 +1524,34 @@ class rustogramer:
             params['units'] = units
         return self._transaction("treevariable/set", params)
 
+    def treevariable_set_list(self, definitions, max_workers=None):
+        """ Not supported in rustogramer.  Set several tree variables:
+        *   definitions - iterable of dicts with the keys 'name', 'value'
+        and 'units' (units may be None).
+        *   max_workers - Number of sets that can be in flight at once.  1
+        makes the sets one at a time in the order given.  If None, the
+        connection's set_workers is used.
+
+        A failure to set one variable does not stop the others from being
+        set.  The return value is a list with an element for each
+        definition; None if it was set or the RustogramerException
+        that explains why not.
+        """
+        def set_one(definition):
+            try:
+                self.treevariable_set(
+                    definition['name'], definition['value'], definition.get('units')
+                )
+            except RustogramerException as e:
+                return e
+            return None
+        if max_workers is None:
+            max_workers = self.set_workers
+        if max_workers <= 1:
+            return [set_one(d) for d in definitions]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(set_one, definitions))
+
     def treevariable_check(self, name):
         """ not supported by rustogamer - check the changed flag for
         treevariable 'name'.
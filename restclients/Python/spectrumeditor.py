@@ -27,11 +27,11 @@ from PyQt5.QtWidgets import (
     QMainWindow, QMessageBox, QPushButton, QComboBox
 )
 from PyQt5.QtCore import *
+from functools import partial
+from importlib import import_module
 from rustogramer_client import rustogramer as Client, RustogramerException
 
-import editor1d, editortwod, editorBitmask
-import  editorG2d, editorGD, editorProjection, editorStripchart
-import editorSummary, EnumeratedTypeSelector, editorGSummary
+import EnumeratedTypeSelector
 from direction import Direction
 from gatelist import ConditionChooser
 
@@ -40,10 +40,18 @@ from gatelist import ConditionChooser
 
 # Utilities.
 
-def default(value, default=0):
-    if value is None:
-        value = default
-    return value
+#  Axis (low, high, bins) from a parameter description; metadata the
+#  parameter does not have gets the tree parameter defaults.
+
+def axis_defaults(description):
+    low = description['low']
+    high = description['hi']
+    bins = description['bins']
+    return (
+        0.0 if low is None else low,
+        512.0 if high is None else high,
+        512 if bins is None else bins
+    )
 def confirm(question, parent=None):
     dlg = QMessageBox(QMessageBox.Warning, 'Confirm?', 
                     question,
@@ -52,36 +60,227 @@ def confirm(question, parent=None):
     dlg = dlg.exec()
     return dlg == QMessageBox.Yes
 
-def error(msg):
+
+#  Non-modal confirmations are referenced here, indexed by their parent,
+#  until they are destroyed so that they survive the return of
+#  confirm_async.
+
+_pending_confirmations = dict()
+
+def confirm_async(question, on_yes, on_no=None, parent=None):
+    #  Like confirm but does not block in a nested event loop.  The
+    #  question is posted and we return at once.  When the user answers,
+    #  on_yes or, if provided, on_no is called.
+    #  A parent asks one question at a time: while one is open, asking
+    #  another (e.g. Create clicked again) just brings the open one to
+    #  the front so its action can't be started twice.
+    pending = _pending_confirmations.get(parent)
+    if pending is not None:
+        pending.raise_()
+        pending.activateWindow()
+        return
+    dlg = QMessageBox(QMessageBox.Warning, 'Confirm?', 
+                    question,
+                    QMessageBox.Yes | QMessageBox.No, parent
+                )
+    dlg.setWindowModality(Qt.NonModal)
+
+    def answered(result):
+        dlg.deleteLater()         # Not now: finished is still being emitted.
+        if result == QMessageBox.Yes:
+            on_yes()
+        elif on_no is not None:
+            on_no()
+    def destroyed():
+        _pending_confirmations.pop(parent, None)
+
+    dlg.finished.connect(answered)
+    dlg.destroyed.connect(destroyed)
+    _pending_confirmations[parent] = dlg
+    dlg.show()
+
+def error(msg, details=None):
+    #  details, if given, is a list of lines (e.g. one per failure of a
+    #  batch operation) put in the dialog's details so a batch makes
+    #  one dialog rather than one per failure.
     dlg = QMessageBox(QMessageBox.Critical, 'Error:', msg, QMessageBox.Ok)
+    if details:
+        dlg.setDetailedText('\n'.join(details))
     dlg.exec()
 
-def ok_to_create(client, editor, name):
+def ok_to_create_async(client, editor, name, on_ok, on_cancel=None):
+    #  Calls on_ok once it's ok to create the spectrum 'name'.  If the
+    #  spectrum exists the user is (non-modally) asked if it should be
+    #  replaced and, if so, it is deleted first.  on_cancel, if provided,
+    #  is called if the user declines.
     info = client.spectrum_list(name)
     if len(info['detail']) > 0:
-        if confirm(f'Spectrum {name} exists, replace?'):
+        def replace():
             try :
                 client.spectrum_delete(name)
             except RustogramerException as e:
                 error(f'Unable to delete {name} before replacing it: {e}')
-                return False
-            editor.spectrum_removed(name)                
-            return True
-        else:
-            return False
+                return
+            editor.spectrum_removed(name)
+            on_ok()
+        confirm_async(f'Spectrum {name} exists, replace?', replace, on_cancel, editor)
     else:
-        return True
+        on_ok()
+#  REST requests that make spectra block for a round trip to the server
+#  so they are run in the global QThreadPool rather than in the GUI
+#  thread.  run_async calls fn(*args) in a pool thread and then, back in
+#  the GUI thread, on_ok with what it returned or on_err with the
+#  exception it raised.  Relays are kept in _running_tasks until they've
+#  delivered the result.
+
+class _TaskRelay(QObject):
+    succeeded = pyqtSignal(object)
+    failed    = pyqtSignal(object)
+
+class _Task(QRunnable):
+    def __init__(self, fn, args, relay):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._relay = relay
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self._relay.failed.emit(e)
+        else:
+            self._relay.succeeded.emit(result)
+
+_running_tasks = set()
+
+def run_async(fn, *args, on_ok=None, on_err=None):
+    relay = _TaskRelay()
+
+    def finished(handler, value):
+        _running_tasks.discard(relay)
+        if handler is not None:
+            handler(value)
+
+    relay.succeeded.connect(partial(finished, on_ok), Qt.QueuedConnection)
+    relay.failed.connect(partial(finished, on_err), Qt.QueuedConnection)
+    _running_tasks.add(relay)
+    QThreadPool.globalInstance().start(_Task(fn, args, relay))
+
+#  Spectra that are created in the same pass through the event loop
+#  (e.g. several creations finishing together) are bound into display
+#  memory with a single sbind_spectra request.  bind_soon queues a name
+#  and, for the first of a batch, schedules the flush.
+
+_pending_binds = []
+
+def _flush_binds(client):
+    names = list(_pending_binds)
+    _pending_binds.clear()
+    def failed(e):
+        error(
+            f'Unable to bind {", ".join(names)} to display memory, but they have been created: {e}'
+        )
+    run_async(client.sbind_spectra, names, on_err=failed)
+
+def bind_soon(client, name):
+    if not _pending_binds:
+        QTimer.singleShot(0, partial(_flush_binds, client))
+    _pending_binds.append(name)
+
+def create_and_bind(client, editor, name, create, *args, on_created=None):
+    #  Create a spectrum by calling create(*args) and, if that worked,
+    #  announce it to the editor and bind it into display memory.
+    #  Creation and binding failures are reported separately since
+    #  a spectrum that could not be bound still exists.
+    #  The requests are made off the GUI thread so this returns at once;
+    #  on_created, if provided, is called once the spectrum was created.
+
+    def created(_):
+        editor.spectrum_added(name)
+        bind_soon(client, name)
+        if on_created is not None:
+            on_created()
+    def failed(e):
+        error(f'Unable to create {name}: {e}')
+
+    run_async(create, *args, on_ok=created, on_err=failed)
+
+#  Parameter and spectrum arrays are sets of names that differ only in
+#  their last path element.  Path elements are separated by '.'.
+
+def _parent_path(name):
+    return name.rpartition('.')[0]
+
+def _leaf(name):
+    return name.rpartition('.')[2]
+
+def _array_pattern(name):
+    # Pattern that matches the names in the same array as name.
+    return _parent_path(name) + '.*'
+
 def gen_param_array(raw_name, client):
     # Generate an array of parameters given the base name:
     # Returns a tuple where .0 are the names and .1 are the
     # full descriptions.
     
-    path = raw_name.split('.')
-    pattern = '.'.join(path[:-1])
-    pattern = pattern + '.*'
+    pattern = _array_pattern(raw_name)
     params  = client.parameter_list(pattern)['detail']
     return ([x['name'] for x in params], params)
 
+#  Adding parameters to a spectrum definition often means several
+#  consecutive adds from the same parameter array (e.g. the X and then
+#  the Y parameters of a P-Gamma spectrum).  ParameterListMemo stands in for
+#  the client's parameter_list method remembering the most recent pattern
+#  and its result so those cost a single request.  Controllers forget
+#  the result once a spectrum is made.
+
+class ParameterListMemo:
+    def __init__(self, client):
+        self._client = client
+        self.forget()
+    def parameter_list(self, pattern='*'):
+        if pattern != self._pattern:
+            self._result = self._client.parameter_list(pattern)
+            self._pattern = pattern
+        return self._result
+    def forget(self):
+        self._pattern = None
+        self._result = None
+
+#  Return the description of a single parameter or None if there's no
+#  such parameter.
+
+def describe_parameter(client, name):
+    matches = client.parameter_list(name)['detail']
+    if len(matches) > 0:
+        return matches[0]
+    return None
+
+#  Parameter choosers emit a selection for every step the user takes
+#  through the tree (e.g. arrow keys).  Debouncer defers the (REST bound)
+#  handling of those until the selection has been stable for msec
+#  milliseconds, and then only handles the last one.  flush handles a
+#  pending one right away; creates call it so they use the axes of the
+#  parameters the user chose.
+
+class Debouncer:
+    def __init__(self, action, msec=75):
+        self._action = action
+        self._args = ()
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(msec)
+        self._timer.timeout.connect(self._fire)
+    def __call__(self, *args):
+        self._args = args
+        self._timer.start()      # Restarts the interval if already pending.
+    def flush(self):
+        if self._timer.isActive():
+            self._timer.stop()
+            self._fire()
+    def _fire(self):
+        self._action(*self._args)
+
 #  Base class for controllers:  Supplies a visibility slot that
 #  can be overidden.
 class AbstractController:
@@ -98,22 +297,21 @@ class AbstractController:
              Controllers that need this just override this method.
         '''
         pass
-# NoneController - for unimplemented creations:
-class NoneController(AbstractController):
-    def __init__(self, editor, view):
-        pass
 ###
 #   Controller that handles the Oned editor view signals:
 class OneDController(AbstractController):
     def __init__(self, editor, view):
         super().__init__()
+        self._client = get_capabilities_client()
         self._editor = editor
         self._view = view
+        self._load_axis_later = Debouncer(self._load_axis)
         view.commit.connect(self.create)
         view.parameterSelected.connect(self.load_param)
     
     def create(self):
-        client = get_capabilities_client()
+        self._load_axis_later.flush()
+        client = self._client
         sname = self._view.name()
         param = self._view.parameter()
         data_type = self._editor.channeltype_string()
@@ -122,74 +320,86 @@ class OneDController(AbstractController):
         # name.
         if sname is not None and len(sname) > 0 and param is not None and len(param) > 0:
             if not self._view.array():
-                if not ok_to_create(client, self._editor, sname):
-                    return
                 low   = self._view.low()
                 high  = self._view.high()
                 bins  = self._view.bins()
-                try:
-                    client.spectrum_create1d(sname, param, low, high, bins, data_type)
-                except RustogramerException as e:
-                    error(f'{e} while creating spectrum')
-                    return
-                try: 
-                    client.sbind_spectra([sname])
-                except RustogramerException as e:
-                    error(
-                        f'{e} while binding spectrum to shared memory {sname} is defined but not displayable'
+
+                def make():
+                    create_and_bind(
+                        client, self._editor, sname, client.spectrum_create1d,
+                        sname, param, low, high, bins, data_type,
+                        on_created=partial(self._view.setName, '')
                     )
-                self._view.setName('')
-                self._editor.spectrum_added(sname)
+                ok_to_create_async(client, self._editor, sname, make)
             else:
                 self._make_spectrum_array(client, sname, param)
 
     def load_param(self, parameter_name):
-        client = get_capabilities_client()
         current_name = self._view.name()
         if current_name is None or len(current_name) == 0:
             self._view.setName(parameter_name)
-        # Regardless if the parameter has metadata load that into the axis definition:
+        # Regardless if the parameter has metadata load that into the axis definition
+        # once the user has settled on a parameter:
 
-        param_info = client.parameter_list(parameter_name)['detail'][0]
-        self._view.setLow(default(param_info['low'], 0))
-        self._view.setHigh(default(param_info['hi'], 512.0),)  # like tree params.
-        self._view.setBins(default(param_info['bins'], 512))
+        self._load_axis_later(parameter_name)
 
      # Internal methods:
 
+    def _load_axis(self, parameter_name):
+        param_info = describe_parameter(self._client, parameter_name)
+        if param_info is None:
+            return
+        self._view.setAxis(*axis_defaults(param_info))
+
     def _gen_name(self, sname, pname):
-        spath = sname.split('.')
-        if len(spath) > 1:
-            spath = spath[0:-1]
-        ppath = pname.split('.')
-        spath.append(ppath[-1])
-        return '.'.join(spath)
+        # Replace the last element of sname (if it has more than one)
+        # with the last element of pname:
+        (parent, separator, _) = sname.rpartition('.')
+        if not separator:
+            parent = sname
+        return parent + '.' + _leaf(pname)
     
     #  If any of the spectra are defined, prompt to proceed or not with their
-    #  replacement:
+    #  replacement.  on_ok is called if we can proceed:
     #   - Assume there's at least one name
     #   - Assume all names can be generated by replacing the last path element with *
     #
-    def _proceed(self, client, names) :
+    def _proceed(self, client, names, on_ok) :
         
         template_name = names[0]  #assume there's at least one
-        pattern = template_name.split('.')[0:-1]
-        pattern.append('*')
-        pattern = '.'.join(pattern)
+        if '.' in template_name:
+            pattern = _array_pattern(template_name)
+        else:
+            pattern = '*'
 
         defs = client.spectrum_list(pattern)['detail']
-        existing_names = [x['name'] for x in defs]
+        existing_names = {x['name'] for x in defs}
 
         duplicate_names = [x for x in names if x in existing_names]
         if len(duplicate_names) > 0 :
-            c = confirm(f'These spectra already exist {duplicate_names} continuing will replace them, do you want to continue?', self._view)
-            if c:
-                for s in duplicate_names:
-                    client.spectrum_delete(s)    # Delete the dups so we can replace.
-                    self._editor.spectrum_removed(s)
-            return c
+            def replace():
+                # Delete the dups so we can replace:
+
+                results = client.spectrum_delete_list(duplicate_names)
+                failures = []
+                for s, e in zip(duplicate_names, results):
+                    if e is None:
+                        self._editor.spectrum_removed(s)
+                    else:
+                        failures.append(f'{s}: {e}')
+                if len(failures) > 0:
+                    error(
+                        f'Unable to delete {len(failures)} spectra before replacing them',
+                        failures
+                    )
+                    return
+                on_ok()
+            confirm_async(
+                f'These spectra already exist {duplicate_names} continuing will replace them, do you want to continue?',
+                replace, parent=self._view
+            )
         else:
-            return True                       # no confirmations needed.
+            on_ok()                           # no confirmations needed.
     def _make_spectrum_array(self, client, sname, param):
 
         #  Get the list of parameters with params base:
@@ -201,24 +411,47 @@ class OneDController(AbstractController):
         # Generate the spectrum names:
 
         spectrum_names = [self._gen_name(sname, x) for x in parameters]
-        if self._proceed(client, spectrum_names):
-            low = self._view.low()
-            high = self._view.high()
-            bins = self._view.bins()
+        low = self._view.low()
+        high = self._view.high()
+        bins = self._view.bins()
 
-            for sname, pname in  zip(spectrum_names, parameters):
+        def make_and_bind():
+            # Runs in the thread pool.
+            results = client.spectrum_create1d_array(
+                spectrum_names, parameters, low, high, bins, data_type
+            )
+            created = [
+                sname for sname, e in zip(spectrum_names, results) if e is None
+            ]
+            bind_error = None
+            if created:
                 try:
-                    client.spectrum_create1d(sname, pname, low, high, bins, data_type)
+                    client.sbind_spectra(created)
                 except RustogramerException as e:
-                    error(f"Failed to create {sname}; {e} won't try to make any more")
-                    return
+                    bind_error = e
+            return (results, created, bind_error)
+        def made(outcome):
+            (results, created, bind_error) = outcome
+            for sname in created:
                 self._editor.spectrum_added(sname)
-                
-            try:
-                client.sbind_spectra(spectrum_names)
-            except RustogramerException as e:
-                error(f"Failed to bind all spectram: {e} some may not be displayable")                
-            self._view.setName('')
+            problems = []
+            if len(created) < len(results):
+                sname = spectrum_names[len(created)]
+                problems.append(f"Failed to create {sname}; {results[-1]} won't try to make any more")
+            if bind_error is not None:
+                problems.append(f"Failed to bind all spectra: {bind_error} some may not be displayable")
+            if problems:
+                error(
+                    f'Made {len(created)} of {len(spectrum_names)} spectra in the array',
+                    problems
+                )
+            if len(created) == len(spectrum_names):
+                self._view.setName('')
+        def failed(e):
+            error(f'Failed to create the spectrum array: {e}')
+        def make():
+            run_async(make_and_bind, on_ok=made, on_err=failed)
+        self._proceed(client, spectrum_names, make)
 
     
 ##
@@ -232,13 +465,21 @@ class TwodController(AbstractController):
         self._editor = editor
         self._view = view
 
+        # Axis loads are deferred until the parameter selection settles:
+
+        self._load_xaxis_later = Debouncer(self.load_xaxis)
+        self._load_yaxis_later = Debouncer(self.load_yaxis)
+
         view.commit.connect(self.create)
-        view.xparameterSelected.connect(self.load_xaxis)
-        view.yparameterSelected.connect(self.load_yaxis)
+        view.xparameterSelected.connect(self._load_xaxis_later)
+        view.yparameterSelected.connect(self._load_yaxis_later)
     
     # SLots:
 
     def create(self):
+        self._load_xaxis_later.flush()
+        self._load_yaxis_later.flush()
+
         # Fetch the spectrum definition from the editor view:
         name = self._view.name()
         
@@ -259,43 +500,38 @@ class TwodController(AbstractController):
         if len(name) > 0 and len(xparam) > 0 and len(yparam) > 0:
             #  Get confirmation if the spectrum exists.
 
-            if not ok_to_create(self._client, self._editor, name):
-                return
-            try:
-                self._client.spectrum_create2d(
+            def make():
+                create_and_bind(
+                    self._client, self._editor, name, self._client.spectrum_create2d,
                     name, xparam, yparam, 
                     xlow, xhigh, xbins, ylow, yhigh, ybins,
-                    chantype
+                    chantype,
+                    on_created=partial(self._view.setName, '')
                 )
-            except RustogramerException as e:
-                error(f'Failed to create {name} : {e}')
-                return
-            self._editor.spectrum_added(name)
-            self._view.setName('')
-
-            try:
-                self._client.sbind_spectra([name])
-            except RustogramerException as e:
-                error(f'Failed to bind {name} - but spectrum was created: {e}')
+            ok_to_create_async(self._client, self._editor, name, make)
     
     def load_xaxis(self, pname):
-        param_info = self._client.parameter_list(pname)['detail'][0]
-        self._view.setXLow(default(param_info['low'], 0))
-        self._view.setXHigh(default(param_info['hi'], 512.0),)  # like tree params.
-        self._view.setXBins(default(param_info['bins'], 512))
+        param_info = describe_parameter(self._client, pname)
+        if param_info is None:
+            return
+        self._view.setXAxis(*axis_defaults(param_info))
     def load_yaxis(self, pname):
-        param_info = self._client.parameter_list(pname)['detail'][0]
-        self._view.setYLow(default(param_info['low'], 0))
-        self._view.setYHigh(default(param_info['hi'], 512.0),)  # like tree params.
-
-        self._view.setYBins(default(param_info['bins'], 512))
+        param_info = describe_parameter(self._client, pname)
+        if param_info is None:
+            return
+        self._view.setYAxis(*axis_defaults(param_info))
 
 ##
 #  Controller for summary spectra.
 #
 class SummaryController(AbstractController):
-    def __init__(self, editor, view):
+    #  create names the client method that makes the spectrum.  Spectrum
+    #  types whose creation takes the same arguments as summary spectra
+    #  (e.g. gamma 1d) are handled by passing in their method name.
+    def __init__(self, editor, view, create='spectrum_createsummary'):
         self._client = get_capabilities_client()
+        self._create = getattr(self._client, create)
+        self._parameters = ParameterListMemo(self._client)
         self._editor = editor
         self._view = view
 
@@ -315,35 +551,28 @@ class SummaryController(AbstractController):
         # Pull the definitions:
         name = self._view.name()
         params = self._view.axis_parameters()
-        low = self._view.low()
-        high = self._view.high()
-        bins = self._view.bins()
+        axes = self.spectrum_axes()
         chantype = self._editor.channeltype_string()
 
         if len(name) > 0:
-            # Are we replacing:
+            # Once we know we can (replacing if need be) create the new spectrum:
 
-            if not ok_to_create(self._client, self._editor, name):
-                return
-                
-            # If we get here we're ready to create the new spectrum:
-
-            try:
-                self.create_actual_spectrum(name, params, low, high, bins, chantype)
-            except RustogramerException as e:
-                error(f'Unable to create {name}: {e}')
-                return
-            self._view.setName('')
-            self._view.setAxis_parameters([])
-            try:
-                self._client.sbind_spectra([name])
-            except RustogramerException as e:
-                error(f'Unable to bind {name} to display memory but it has been created.')
+            def created():
+                self._view.setName('')
+                self._view.setAxis_parameters([])
+                self._parameters.forget()
+            def make():
+                create_and_bind(
+                    self._client, self._editor, name, self._create,
+                    name, params, *axes, chantype,
+                    on_created=created
+                )
+            ok_to_create_async(self._client, self._editor, name, make)
 
-    # Support subclassing with different spectrum type:
-    def create_actual_spectrum(self, name, params, low, high, bins, chantype):
-        self._client.spectrum_createsummary(name, params, low, high, bins, chantype)
-        self._editor.spectrum_added(name)
+    # The axis arguments to the create method.  Subclasses for spectrum
+    # types with other axes override this:
+    def spectrum_axes(self):
+        return (self._view.low(), self._view.high(), self._view.bins())
     
     def client(self):
         return self._client
@@ -365,9 +594,7 @@ class SummaryController(AbstractController):
         # Note _parameter_list takes care of loading the axis definition
         # if desired and available.
 
-        names = self._parameter_list(name)
-        names.sort()
-        full_list = self._view.axis_parameters() + names
+        full_list = self._view.axis_parameters() + sorted(self._parameter_list(name))
         self._view.setAxis_parameters(full_list)
 
     # Private utilities.abs
@@ -376,163 +603,124 @@ class SummaryController(AbstractController):
     # box and, if requested, update the axis definitions from parameter metadat
     #
     def _parameter_list(self, base):
-        pattern = base
-
         if self._view.array():
-            params = gen_param_array(base, self._client)
+            params = gen_param_array(base, self._parameters)
         else:
-            defs = self._client.parameter_list(base)['detail']
-            params = ([base], [defs])
+            description = describe_parameter(self._parameters, base)
+            params = ([base], [description] if description is not None else [])
         
         #  Get the parameter definiions and:
         #  extract the names into a list and, if axis_from_parameters is
         #  in fill in the axis  values when we have a parameter with metadata.
+        #  Each parameter's axis overwrites the previous one so only the
+        #  last matters.
 
         descriptions = params[1]
         names = params[0]
         
-        if self._view.axis_from_parameters():
-            for p in descriptions:
-                self.setaxis_from_parameter(p)
+        if self._view.axis_from_parameters() and len(descriptions) > 0:
+            self.setaxis_from_parameter(descriptions[-1])
                 
 
         return names
     def setaxis_from_parameter(self, p):
         
-        self._view.setLow(default(p['low'], 0.0))
-        self._view.setHigh(default(p['hi'], 512.0))
-        self._view.setBins(default(p['bins'], 512))
-
+        self._view.setAxis(*axis_defaults(p))
 
-##  Gamma 1d is just like a summary spectrum but makes a different specturm type:
-
-class G1DController(SummaryController):
-    def __init__(self, editor, view):
-        super().__init__(editor, view)
-    def create_actual_spectrum(self, name, params, low, high, bins , chantype):
-        client = self.client()
-        client.spectrum_createg1(name, params, low, high, bins , chantype)
-        self._editor.spectrum_added(name)
 
 ## Gamma 2d is just Summary controller with overrides for both
-#  create_actual_spectrum and setaxis_from_parameter
+#  spectrum_axes and setaxis_from_parameter
 #
 
 class G2DController(SummaryController):
     def __init__(self, editor, view):
-        super().__init__(editor, view)
-
-    def create_actual_spectrum(self, name, params, low, high, bins, chantype):
-        # low, high, bins are for the yaxis:
+        super().__init__(editor, view, create='spectrum_createg2')
 
+    def spectrum_axes(self):
         view = self.view()
-        xlow = view.xlow()
-        xhigh = view.xhigh()
-        xbins = view.xbins()
-        
-        ylow = view.ylow()
-        yhigh = view.yhigh()
-        ybins = view.ybins()
-
-        self.client().spectrum_createg2(
-            name, params, xlow, xhigh, xbins, ylow, yhigh, ybins, chantype
+        return (
+            view.xlow(), view.xhigh(), view.xbins(),
+            view.ylow(), view.yhigh(), view.ybins()
         )
-        self._editor.spectrum_added(name)
 
     def setaxis_from_parameter(self, p):
         view = self.view()
-        low = default(p['low'], 0)
-        view.setXlow(low)
-        view.setYlow(low)
-
-        hi = default(p['hi'], 512.0)
-        view.setXhigh(hi)
-        view.setYhigh(hi)
-
-        bins = default(p['bins'], 512)
-        view.setXbins(bins)
-        view.setYbins(bins)
+        (low, hi, bins) = axis_defaults(p)
+        view.setAxes(low, hi, bins, low, hi, bins)
 
 #
 #   Controller to build particle gamma spectra (GD).
 #
 class PGammaController(AbstractController):
-    def __init__(self, editor, view):
+    #  create names the client method that makes the spectrum.
+    #  As for SummaryController this lets us make 2d sum spectra too.
+    def __init__(self, editor, view, create='spectrum_creategd'):
         self._editor = editor
         self._view   = view
         self._client = get_capabilities_client()
+        self._create = getattr(self._client, create)
+        self._parameters = ParameterListMemo(self._client)
         self._view.addXParameters.connect(self.addx)
         self._view.addYParameters.connect(self.addy)
         self._view.commit.connect(self.commit)
+    def visible(self):
+        #  addx/addy share the memoized parameter listing so filling both
+        #  from the same array is one REST call.  Parameters may have
+        #  changed while another editor was up, so start afresh.
+        self._parameters.forget()
     def addx(self):
         params = self._get_parameters()
         if self._view.axis_from_parameters():
             self._set_axis_defs(params)
-        names = [x['name'] for x in params]
-        names.sort()
-        for name in names:
+        for name in sorted(x['name'] for x in params):
             self._view.addXparameter(name)
     def addy(self):
         params = self._get_parameters()
         if self._view.axis_from_parameters():
             self._set_axis_defs(params)
-        names = [x['name'] for x in params]
-        names.sort()
-        for name in names:
+        for name in sorted(x['name'] for x in params):
             self._view.addYparameter(name)
     def commit(self):
         name = self._view.name()
         if name == '':
             return
 
-        #  If there's already a spectrum of this name ensure we can replace:
+        xparams = self._view.xparameters()
+        yparams = self._view.yparameters()
+        xlow    = self._view.xlow()
+        xhigh   = self._view.xhigh()
+        xbins   = self._view.xbins()
+        ylow    = self._view.ylow()
+        yhigh   = self._view.yhigh()
+        ybins   = self._view.ybins()
+        dtype   = self._editor.channeltype_string()
 
-        if self._create_ok(name):
-            xparams = self._view.xparameters()
-            yparams = self._view.yparameters()
-            xlow    = self._view.xlow()
-            xhigh   = self._view.xhigh()
-            xbins   = self._view.xbins()
-            ylow    = self._view.ylow()
-            yhigh   = self._view.yhigh()
-            ybins   = self._view.ybins()
-            dtype   = self._editor.channeltype_string()
-
-            # Try to create the spectrum:
-
-            try:
-                self.create_actual_spectrum(
-                    name, xparams, yparams, xlow, xhigh, xbins, ylow, yhigh, ybins, dtype
-                )
-            except RustogramerException as e:
-                error(f'Failed to create {name}: {e}')
-                return
+        # Try to create the spectrum and bind it to display memory:
 
+        def created():
             self._view.setName('')
             self._view.setXparameters([])   # Clear the editor for next time.
             self._view.setYparameters([])
+            self._parameters.forget()
+        def make():
+            create_and_bind(
+                self._client, self._editor, name, self._create,
+                name, xparams, yparams, xlow, xhigh, xbins, ylow, yhigh, ybins, dtype,
+                on_created=created
+            )
 
-            # Try to bind it to display memory:
+        #  If there's already a spectrum of this name ensure we can replace:
 
-            try:
-                self._client.sbind_list([name])
-            except RustogramerException as e:
-                error(f'Failed to bind {name} to shared memory: {e}, Spectrum was made, however')
+        self._create_ok(name, make)
 
-    def create_actual_spectrum(self, name, xparams, yparams, xlow, xhigh, xbins, ylow, yhigh, ybins, dtype):
-        self._client.spectrum_creategd(
-                    name, xparams, yparams, xlow, xhigh, xbins, ylow, yhigh, ybins, dtype
-                )
-        self._editor.spectrum_added(name)
-    
     # Utility methods
 
-    def _create_ok(self, name):
-        # Returns true if it's ok to make the spectrum.
+    def _create_ok(self, name, on_ok):
+        # Calls on_ok when it's ok to make the spectrum.
         # If the spectrum exists, we require the user to confirm the
         # replacement and delete the spectrum.
 
-        return  ok_to_create(self._client, self._editor, name)
+        ok_to_create_async(self._client, self._editor, name, on_ok)
         
 
     def _get_parameters(self):
@@ -542,7 +730,7 @@ class PGammaController(AbstractController):
         if self._view.array():
             params = self._make_parameter_list(name)
         else:
-            params = self._client.parameter_list(name)['detail']
+            params = self._parameters.parameter_list(name)['detail']
         return params
 
     def _make_parameter_list(self, sample):
@@ -551,47 +739,26 @@ class PGammaController(AbstractController):
 
         # Create the listing search path:
 
-        path = sample.split('.')
-        path = path[0:-1]
-        path = '.'.join(path)
-        pattern = path + '.*'
+        pattern = _array_pattern(sample)
         
         #  get the matching parameter descriptions:
 
-        descriptions = self._client.parameter_list(pattern)['detail']
+        descriptions = self._parameters.parameter_list(pattern)['detail']
         return descriptions
 
     def _set_axis_defs(self, parameters):
         #  Given a set of parameter descriptions, set the axis definitions
-        #  from them.
-
-        for param in parameters:
-            low = default(param['low'], 0.0)
-            high= default(param['hi'], 512.0)
-            bins= default(param ['bins'], 512)
-            if low is not None:
-                self._view.setXlow(low)
-                self._view.setYlow(low)
-            if high is not None:
-                self._view.setXhigh(high)
-                self._view.setYhigh(high)
-            if bins is not None:
-                self._view.setXbins(bins)
-                self._view.setYbins(bins)
-                
+        #  from them.  The last parameter's definitions are the ones that
+        #  stick so those are the only ones we need to look at.
 
+        if len(parameters) == 0:
+            return
+        param = parameters[-1]
+        (low, high, bins) = axis_defaults(param)
+        self._view.setAxes(low, high, bins, low, high, bins)
+                
 
-# Making a 2d sum is like making a gamma deluxe .. we'll let the
-# server enforce that the number of x/y params must be the same:
 
-class TwoDSumController(PGammaController):
-    def __init__(self, editor, view):
-        super().__init__(editor, view)
-    def create_actual_spectrum(self, name, xparams, yparams, xlow, xhigh, xbins, ylow, yhigh, ybins, dtype):
-        self._client.spectrum_create2dsum(
-            name, xparams, yparams, xlow, xhigh, xbins, ylow, yhigh,ybins, dtype
-        )
-        self._editor.spectrum_added(name)
 #  Controller for spectrum projections:
 
 class ProjectionController(AbstractController):
@@ -605,8 +772,7 @@ class ProjectionController(AbstractController):
         # of that list we need to load contours for the contours visibl
         # on the first of those spectra:
 
-        self._loadspectra()
-        self._loadContours(self._view.spectrum())
+        self.visible()
 
         # Connect to singal handlers
 
@@ -616,21 +782,52 @@ class ProjectionController(AbstractController):
     # slot overrides:
 
     def visible(self):
-        self._loadspectra()
-        self._loadContours(self._view.spectrum())
+        #  The spectrum and condition lists are independent so fetch
+        #  them concurrently in the thread pool.  The spectrum list
+        #  also has the definition of the spectrum whose contours we
+        #  show so that needs no request of its own.
+
+        fetched = dict()
+        def got(key, value):
+            fetched[key] = value
+            if 'spectra' in fetched and 'conditions' in fetched:
+                self._load(fetched['spectra'], fetched['conditions'])
+        def failed(e):
+            if 'failed' not in fetched:      # Only complain once.
+                fetched['failed'] = e
+                error(f'Unable to load projectable spectra and contours: {e}')
+        run_async(
+            lambda: self._client.spectrum_list()['detail'],
+            on_ok=partial(got, 'spectra'), on_err=failed
+        )
+        run_async(
+            lambda: self._client.condition_list()['detail'],
+            on_ok=partial(got, 'conditions'), on_err=failed
+        )
     #  Create the spectrum:
 
     def _create(self):
         # If there's no proposed name give up:
 
         name = self._view.name()
-        if name.isspace():
+        if not name or name.isspace():
+            error('A name is needed for the projection spectrum')
             return
+        # Likewise if there's nothing to project or the projection is
+        # in a contour that's not been chosen.  These checks are all
+        # local so make them before asking the server about the name.
+
         source = self._view.spectrum()
+        if not source:
+            error('Choose a spectrum to project')
+            return
         snap   = self._view.snapshot()
         incontour = self._view.contour()
         if incontour:
             contour_name = self._view.contour_name()
+            if not contour_name:
+                error('Choose the contour to project within or uncheck the contour box')
+                return
         else:
             contour_name = None
         direction = self._view.direction()
@@ -640,46 +837,40 @@ class ProjectionController(AbstractController):
             direction_str = 'y'
 
         #  IF name is an existing spectrum we need permission
-        # to overwrite it:
-
-        if not ok_to_create(self._client, self._editor, name):
-            return
-        
-        # Now we can get on with making the spectrum and
-        # binding it into display memory.
-
-        try:
-            self._client.project(
-                source, name, direction_str, snap, contour_name
-            )
-        except RustogramerException as e:
-            error(f'Could not create {name} projection of {source}: {e}')
-            return
-        # Got made so now try to sbind it:
+        # to overwrite it.  Once we have it we can get on with making
+        # the spectrum and binding it into display memory.
 
-        self._editor.spectrum_added(name)
-        try:
-            self._client.sbind_list([name])
-        except RustogramerException as e:
-            error(f'Could not bind {name} to display memory but it it has been created: {e}')
+        ok_to_create_async(self._client, self._editor, name, partial(
+            create_and_bind,
+            self._client, self._editor, name, self._client.project,
+            source, name, direction_str, snap, contour_name
+        ))
 
 
     #  Utilties:
 
-    def _loadspectra(self):
-        all_spectra = self._client.spectrum_list()['detail']
-        twod_spectra = [x['name'] for x in all_spectra if self._isprojectable(x)]
-        twod_spectra.sort()
+    def _load(self, all_spectra, all_conditions):
+        # Load the view from the spectrum and condition lists:
+
+        twod_spectra = sorted(x['name'] for x in all_spectra if self._isprojectable(x))
         self._view.setSpectra(twod_spectra)
-        pass
+        chosen = self._view.spectrum()
+        spectrum_def = [x for x in all_spectra if x['name'] == chosen]
+        self._setContours(spectrum_def, all_conditions)
 
     def _loadContours(self, spectrum_name):
         spectrum_def = self._client.spectrum_list(spectrum_name)['detail']
+        if len(spectrum_def) > 0:
+            self._setContours(spectrum_def, self._client.condition_list()['detail'])
+
+    def _setContours(self, spectrum_def, all_conditions):
         if len(spectrum_def) > 0:
             spectrum_def = spectrum_def[0]
-            all_conditions = self._client.condition_list()['detail']
+            xpars = frozenset(spectrum_def['xparameters'])
+            ypars = frozenset(spectrum_def['yparameters'])
+            xypars = xpars | ypars
             displayable_contours = [x['name'] for x in all_conditions  \
-                if self._is_displayable_contour(spectrum_def, x)]
+                if self._is_displayable_contour(xpars, ypars, xypars, x)]
             self._view.setContours(displayable_contours)
 
     def _isprojectable(self, spectrum):
@@ -690,13 +881,12 @@ class ProjectionController(AbstractController):
             (spectrum['xaxis'] is not None) and 
             (spectrum['yaxis'] is not None))
     
-    def _is_displayable_contour(self, spectrum_def, condition):
+    def _is_displayable_contour(self, xpars, ypars, xypars, condition):
         #   Return true if the codition is
         #   1. A contour or multi contour ('c' or 'gc')
-        #   2. Its x and y parameters are all present on the spectrum_def
-
-        xpars = spectrum_def['xparameters']
-        ypars = spectrum_def['yparameters']
+        #   2. Its x and y parameters are all present on the spectrum.
+        #  xpars, ypars are sets of the spectrum's x and y parameters and
+        #  xypars their union.
 
         gate_params = self._index_or_none(condition, 'parameters')
 
@@ -705,17 +895,11 @@ class ProjectionController(AbstractController):
         if condition['type'] == 'c':
             return gate_params[0] in xpars and gate_params[1] in ypars
         elif condition['type'] == 'gc':
-            for p in gate_params:
-                if p not in xpars and p not in ypars:
-                    return False
-            return True
+            return xypars.issuperset(gate_params)
         else:
             return False
     def _index_or_none(self, map, idx):
-        if idx in map.keys():
-            return map[idx]
-        else:
-            return None
+        return map.get(idx)
 
 #   Controller to handle stript chart spectra.
 
@@ -733,26 +917,18 @@ class StripChartController(AbstractController):
         name = self._view.name()
         if name.isspace():
             return
-        if ok_to_create(self._client, self._editor, name):
-            tparam = self._view.xparam()
-            vparam = self._view.yparam()
-            low = self._view.low()
-            high = self._view.high()
-            bins = self._view.bins()
-
-            try:
-                self._client.spectrum_createstripchart(
-                    name, tparam, vparam, low, high, bins, 
-                    self._editor.channeltype_string()
-                )
-                self._editor.spectrum_added(name)
-            except RustogramerException as e:
-                error(f"Unable to create: {name} : {e}")
-                return
-            try:
-                self._client.sbind_list([name])
-            except RustogramerException as e:
-                error(f'Unable to bind {name} to display memory, though it was created: {e}')
+        tparam = self._view.xparam()
+        vparam = self._view.yparam()
+        low = self._view.low()
+        high = self._view.high()
+        bins = self._view.bins()
+
+        ok_to_create_async(self._client, self._editor, name, partial(
+            create_and_bind,
+            self._client, self._editor, name, self._client.spectrum_createstripchart,
+            name, tparam, vparam, low, high, bins, 
+            self._editor.channeltype_string()
+        ))
 
 # Controller for bitmask spectra:
 class BitMaskController(AbstractController):
@@ -766,27 +942,20 @@ class BitMaskController(AbstractController):
         name = self._view.name()
         if name.isspace():
             return
-        if ok_to_create(self._client, self._editor, name):
-            try:
-                self._client.spectrum_createbitmask(
-                    name, 
-                    self._view.parameter(), self._view.bits(), 
-                    self._editor.channeltype_string()
-                )
-                self._editor.spectrum_added(name)
-            except RustogramerException as e:
-                error(f'Unable to create {name}: {e}')
-                return
-            try :
-                self._client.sbind_list([name])
-            except RustogramerException as e:
-                error('Unable to bind {name} to spectrum memory but it has been created: {e}')
+        ok_to_create_async(self._client, self._editor, name, partial(
+            create_and_bind,
+            self._client, self._editor, name, self._client.spectrum_createbitmask,
+            name, 
+            self._view.parameter(), self._view.bits(), 
+            self._editor.channeltype_string()
+        ))
 
 class GammaSummaryController(AbstractController):
     def __init__(self, editor, view):
         self._editor = editor
         self._view   = view
         self._client = get_capabilities_client()
+        self._parameters = ParameterListMemo(self._client)
 
         # Connect the view signals I care about:
 
@@ -800,24 +969,15 @@ class GammaSummaryController(AbstractController):
         params = self._fetch_parameters()
         if len(params) == 0:
             return                  # need some parameters too.
-        if ok_to_create(self._client, self._editor, name):
-            # Try to create the spectrum:
-            try:
-                self._client.spectrum_creategammasummary(
-                    name, params, 
-                    self._view.low(), self._view.high(), self._view.bins(),
-                    self._editor.channeltype_string()
-                )
-                self._editor.spectrum_added(name)
-            except RustogramerException as e:
-                error(f'Unable to create spectrum {name}: {e}')
-                return
-            
-            # try to bind it to display memory:
-            try:
-                self._client.sbind_list([name])
-            except RustogramerException as e:
-                error(f'Unable to bind {name} to display memory but it was created: {e}')
+        # Once it's ok, try to create the spectrum and bind it to display memory:
+        ok_to_create_async(self._client, self._editor, name, partial(
+            create_and_bind,
+            self._client, self._editor, name, self._client.spectrum_creategammasummary,
+            name, params, 
+            self._view.low(), self._view.high(), self._view.bins(),
+            self._editor.channeltype_string(),
+            on_created=self._parameters.forget
+        ))
             
     def _addparameter(self):
         # Fetch the parameter name:
@@ -826,12 +986,13 @@ class GammaSummaryController(AbstractController):
         if raw_name.isspace():
             return                    # no name selected to add.
         if self._view.array():
-            info = gen_param_array(raw_name, self._client)
+            info = gen_param_array(raw_name, self._parameters)
             names =  info[0]
             defs  =  info[1]
         else:
             names = [raw_name]
-            defs  = self._client.parameter_list(raw_name)['detail']
+            description = describe_parameter(self._parameters, raw_name)
+            defs  = [description] if description is not None else []
 
         # Names are added to the current list
 
@@ -839,59 +1000,58 @@ class GammaSummaryController(AbstractController):
             self._view.addParameter(name)
         
         # If from axis is set, we load the axis information from any
-        # availabe data in defs:
+        # availabe data in defs.  The last parameter with each bit of
+        # metadata is the one that sticks, metadata no parameter has
+        # leaves the axis as it was:
 
         if self._view.axis_from_param():
-            for d in defs:
-                low = d['low']
-                high = d['hi']
-                bins = d['bins']
-                if low is not None:
-                    self._view.setLow(d['low'])
-                if high is not None:
-                    self._view.setHigh(high)
-                if bins is not None:
-                    self._view.setBins(bins)
+            self._view.setAxis(
+                self._last_defined(defs, 'low', self._view.low()),
+                self._last_defined(defs, 'hi', self._view.high()),
+                self._last_defined(defs, 'bins', self._view.bins())
+            )
+    def _last_defined(self, defs, key, current):
+        return next((d[key] for d in reversed(defs) if d[key] is not None), current)
     def _fetch_parameters(self):
         # Returns the list of parameter lists... or an empty list if all
         # channels are empty
         # It is legitimate for the user to want empty channels as spacers e.g.
         # between clumps of stuff.
-        chans = self._view.xchannels()
-        result = []
-        total_pars = 0
-        for c in range(chans):
-            params = self._view.getChannel(c)
-            total_pars += len(params)
-            result.append(params)
-        if total_pars == 0:
-            result =[]           # No parameters in any channels.
-        print("Fetched", result)
+        result = [self._view.getChannel(c) for c in range(self._view.xchannels())]
+        if not any(result):
+            result = []           # No parameters in any channels.
         return result
 
-#  This dict is a table, indexed by tab name, of the class objects
-#  that edit that spectrum type and the enumerator type in capabilities.
-#  e.g. '1D': (SpectrumTypes.Oned, editor1d.onedEditor, onedcontroller) - means
-#  The tab labeled 1D will be added if the SpectrumTypes.Oned is supported by
-#  the server and will contain an editor1d.onedEditor and that onedcontroller
-#  will be instantiated to handle signals from the editor.
+#  This is a table, in tab order, of the tab names, the enumerator type in
+#  capabilities and the (module, class) names of the editor for that spectrum
+#  type and the controller class.
+#  e.g. ('1D', SpectrumTypes.Oned, ('editor1d', 'oneDEditor'), OneDController)
+#  - means The tab labeled 1D will be added if the SpectrumTypes.Oned is
+#  supported by the server and will contain an editor1d.oneDEditor and that
+#  OneDController will be instantiated to handle signals from the editor.
+#  Editor modules are only imported when their tab is first shown.
 #
 #  In the future, the classes may be self contained MVC bundles so we don't
 #  have to concern ourselves with connecting slots etc.
-_spectrum_widgets = {
-    '1D': (SpectrumTypes.Oned, editor1d.oneDEditor, OneDController),
-    '2D': (SpectrumTypes.Twod, editortwod.TwoDEditor, TwodController),
-    'Summary': (SpectrumTypes.Summary, editorSummary.SummaryEditor, SummaryController),
-    'Gamma 1D' : (SpectrumTypes.Gamma1D, editorSummary.SummaryEditor,G1DController),
-    'Gamma 2D' : (SpectrumTypes.Gamma2D, editorG2d.Gamma2DEditor, G2DController),
-    'P-Gamma'  : (SpectrumTypes.GammaDeluxe, editorGD.GammaDeluxeEditor, PGammaController),
-    '2D Sum'   : (SpectrumTypes.TwodSum, editorGD.GammaDeluxeEditor, TwoDSumController),
-    'Projection' : (SpectrumTypes.Projection, editorProjection.ProjectionEditor, ProjectionController),
-    'StripChart' : (SpectrumTypes.StripChart, editorStripchart.StripChartEditor, StripChartController),
-    'Bitmask' : (SpectrumTypes.Bitmask, editorBitmask.BitmaskEditor, BitMaskController),
-    'Gamma summary' : (SpectrumTypes.GammaSummary, editorGSummary.GammaSummaryEditor, GammaSummaryController)
+_spectrum_widgets = (
+    ('1D', SpectrumTypes.Oned, ('editor1d', 'oneDEditor'), OneDController),
+    ('2D', SpectrumTypes.Twod, ('editortwod', 'TwoDEditor'), TwodController),
+    ('Summary', SpectrumTypes.Summary, ('editorSummary', 'SummaryEditor'), SummaryController),
+    #  Gamma 1d is just like a summary spectrum but makes a different specturm type:
+    ('Gamma 1D', SpectrumTypes.Gamma1D, ('editorSummary', 'SummaryEditor'),
+        partial(SummaryController, create='spectrum_createg1')),
+    ('Gamma 2D', SpectrumTypes.Gamma2D, ('editorG2d', 'Gamma2DEditor'), G2DController),
+    ('P-Gamma', SpectrumTypes.GammaDeluxe, ('editorGD', 'GammaDeluxeEditor'), PGammaController),
+    #  Making a 2d sum is like making a gamma deluxe .. we'll let the
+    #  server enforce that the number of x/y params must be the same:
+    ('2D Sum', SpectrumTypes.TwodSum, ('editorGD', 'GammaDeluxeEditor'),
+        partial(PGammaController, create='spectrum_create2dsum')),
+    ('Projection', SpectrumTypes.Projection, ('editorProjection', 'ProjectionEditor'), ProjectionController),
+    ('StripChart', SpectrumTypes.StripChart, ('editorStripchart', 'StripChartEditor'), StripChartController),
+    ('Bitmask', SpectrumTypes.Bitmask, ('editorBitmask', 'BitmaskEditor'), BitMaskController),
+    ('Gamma summary', SpectrumTypes.GammaSummary, ('editorGSummary', 'GammaSummaryEditor'), GammaSummaryController)
 
-}
+)
 #
 #   This table maps the SpecTcl/rustogramer type strings to the tab
 #   strings.   This allows us to lookup the tab index given a spectrum descriptiion
@@ -918,6 +1078,23 @@ _channel_types = {
     'word': ChannelTypes.Short,
     'byte' : ChannelTypes.Byte
 }
+#  Called when a tab whose controller has no use for visible() is shown:
+
+def _noop():
+    pass
+
+#  The sidebar buttons in the order they appear.  Each entry is the
+#  Editor attribute holding the button, its label and the Editor signal
+#  its clicked signal is relayed to.
+
+_sidebar_buttons = (
+    ('_clear', 'Clear', 'clear_selected'),
+    ('_clearall', 'Clear all', 'clear_all'),
+    ('_del', 'Delete', 'delete_selected'),
+    ('_gate', 'Gate', 'gate_selected'),
+    ('_ungate', 'Ungate', 'ungate_selected'),
+    ('_loadspectrum', 'Load editor', 'load')
+)
 #   This class assumes that the capabilities client has already been set:
 class Editor(QWidget):
     new_spectrum = pyqtSignal(str)
@@ -929,8 +1106,6 @@ class Editor(QWidget):
     ungate_selected = pyqtSignal()
     load   = pyqtSignal()
     def __init__(self, *args):
-        global _spectrum_widgets
-        global _channel_types
 
         super().__init__(*args)
 
@@ -938,111 +1113,141 @@ class Editor(QWidget):
 
         layout = QHBoxLayout()
 
-        #At the left is a tabbed widget:
+        #At the left is a tabbed widget, at the right a sidebar:
 
+        self._build_tabs()
+        self._populate_channel_types()
+        layout.addWidget(self.tabs)
+        self._build_sidebar(layout)
+        
+        self.setLayout(layout)
+        self.showSidebar()
+        
+        self._connect_signals()
+
+        # Maps spectrum type strings to the methods that fill their editors
+        # in load_editor:
+
+        self._fillers = {
+            '1' : self._fill1d,
+            '2' : self._fill2d,
+            's' : self._fillsummary,
+            'g1': self._fillgamma1,
+            'g2': self._fillgamma2,
+            'gd': self._fillpgamma,
+            'm2': self._fill2dsum,
+            'S' : self._fillstripchart,
+            'b' : self._fillbitmask,
+            'gs': self._fillgsummary
+        }
+
+    #  The first tab's editor is built when we're first shown rather than
+    #  at construction so that the window can be laid out and painted first.
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if not self._populated:
+            self._populated = True
+            index = self.tabs.currentIndex()
+            if index >= 0 and self._controllers_by_index[index] is None:
+                self._build_editor(self._tab_labels[index])
+
+    def _build_tabs(self):
         self.tabs = QTabWidget(self)   
         self.tabs.setUsesScrollButtons(True)
         self.editors = dict()     # Dict of editors (views) indexed by label.
         self.controllers = dict() # Dict of controllers indexed by label.
         self.tab_indices = dict() # dict of tab indices indexed by label.
-        # Stock it with the supported spectrum editors:
+        self._pending = dict()    # Editor info for tabs not yet built, indexed by label.
+        self._tab_labels = list() # Tab labels indexed by tab index.
+        self._controllers_by_index = list() # Controllers (None if not built) by tab index.
+        self._on_visible = list() # What to call when each tab becomes visible.
+        self._populated = False   # True once the first editor is built.
+        # Stock it with the supported spectrum editors.  An editor and its
+        # controller are only built when their tab is first shown, until
+        # then the tab is an empty page the editor will be put in:
 
         supported_specs = get_supported_spectrumTypes()
+        add_tab = self.tabs.addTab
         index = 0
-        for label in _spectrum_widgets.keys():
-            info = _spectrum_widgets[label]
-            if info[0] in supported_specs:
-                self.editors[label] = info[1](self)  # So we can get this in the editors.
-                self.tabs.addTab(self.editors[label], label)
-                self.controllers[label] = info[2](self, self.editors[label]) # hook in controller.
+        for label, stype, editor_name, controller_cls in _spectrum_widgets:
+            if stype in supported_specs:
+                page = QWidget(self.tabs)
+                page_layout = QVBoxLayout()
+                page_layout.setContentsMargins(0, 0, 0, 0)
+                page.setLayout(page_layout)
+                add_tab(page, label)
+                self._pending[label] = (editor_name, controller_cls)
                 self.tab_indices[label] = index
+                self._tab_labels.append(label)
+                self._controllers_by_index.append(None)
+                self._on_visible.append(partial(self._build_editor, label))
                 index += 1
-        
 
+    def _populate_channel_types(self):
         self.channelType = EnumeratedTypeSelector.TypeSelector()
         supported_ctypes = get_supported_channelTypes()
 
-        for label in _channel_types.keys():
-            t = _channel_types[label]
-            if t in supported_ctypes:
-                self.channelType.addItem(label, t)
+        self.channelType.addTypes(
+            (label, t) for label, t in _channel_types.items() if t in supported_ctypes
+        )
+        # Track the selection so channeltype_string needn't ask the widget:
 
-        layout.addWidget(self.tabs)
+        self._channel_type = self.channelType.selectedText()
+        self.channelType.selected.connect(self._channel_type_selected)
+
+    def _build_sidebar(self, layout):
         right = QVBoxLayout()
-        self._clear = QPushButton('Clear', self)
-        right.addWidget(self._clear)
-        self._clearall= QPushButton('Clear all', self)
-        right.addWidget(self._clearall)
-        self._del = QPushButton("Delete", self)
-        right.addWidget(self._del)
+        for attr, text, _ in _sidebar_buttons:
+            button = QPushButton(text, self)
+            setattr(self, attr, button)
+            right.addWidget(button)
+        # The gate chooser goes just above the Gate button:
+
         self._gateselection = ConditionChooser( self)
-        right.addWidget(self._gateselection)
-        self._gate = QPushButton('Gate');
-        right.addWidget(self._gate)
-        self._ungate = QPushButton('Ungate')
-        right.addWidget(self._ungate)
-        self._loadspectrum = QPushButton('Load editor')
-        right.addWidget(self._loadspectrum)
+        right.insertWidget(right.indexOf(self._gate), self._gateselection)
         self.chtlabel = QLabel('Channel Type:')
         right.addWidget(self.chtlabel)
         right.addWidget(self.channelType)
         right.addStretch(1)
         self._sidebar = right
+
+        # Hiding the sidebar leaves the channel type visible:
+
+        self._sidebar_hideable = [getattr(self, attr) for attr, _, _ in _sidebar_buttons]
+        self._sidebar_hideable.append(self._gateselection)
+        self._sidebar_widgets = self._sidebar_hideable + [self.chtlabel, self.channelType]
         
         layout.addLayout(self._sidebar)
-        
-        self.setLayout(layout)
-        self.showSidebar()
-        
-        self._clear.clicked.connect(self.clear_selected)
-        self._clearall.clicked.connect(self.clear_all)
-        self._del.clicked.connect(self.delete_selected)
-        self._gate.clicked.connect(self.gate_selected)
-        self._ungate.clicked.connect(self.ungate_selected)
-        self._loadspectrum.clicked.connect(self.load)
+
+    def _connect_signals(self):
+        for attr, _, signal in _sidebar_buttons:
+            getattr(self, attr).clicked.connect(getattr(self, signal))
 
         self.tabs.currentChanged.connect(self._new_editor_visible)
     
     def hideSidebar(self):
-        sidebar = self._sidebar
-        i = 0
-        item = sidebar.itemAt(i)
-        while item is not None:
-            w = item.widget()
-            if w is not None and w != self.channelType and w != self.chtlabel:
-                w.hide()
-            i += 1
-            item = sidebar.itemAt(i)
+        for w in self._sidebar_hideable:
+            w.hide()
         
     def showSidebar(self):
-        
-        sidebar = self._sidebar
-        i = 0
-        item = sidebar.itemAt(i)
-        while item is not None:
-            w = item.widget()     # Could be a stretch e.g.
-            if w is not None:
-                w.show()
-            i += 1
-            item = sidebar.itemAt(i)
+        for w in self._sidebar_widgets:
+            w.show()
+    @pyqtSlot(int)
     def _new_editor_visible(self, index):
         
-        controller = self.controllers[self.tabs.tabText(index)]
-        controller.visible()
+        # Until a tab's editor is built this builds it (a new controller
+        # loads itself), after that it's the controller's visible method
+        # or nothing if the controller doesn't care.
+
+        self._on_visible[index]()
        
     # Get the currently selected channel type string
     
     def channeltype_string(self):
-       return self.channelType.selectedText()
-
-    def load_gates(self, client):
-        #  Load gates into self._gateselection
-        while self._gateselection.count() > 0:
-            self._gateselection.removeItem(0)
-
-        condition_names = [x['name'] for x in client.condition_list()['detail']]
-        condition_names.sort()    # Alpha so easy to find.
-        self._gateselection.addItems(condition_names)
+       return self._channel_type
+    def _channel_type_selected(self, text, value):
+        self._channel_type = text
 
     def selected_gate(self):
         return self._gateselection.currentText()
@@ -1050,47 +1255,26 @@ class Editor(QWidget):
     # Slot that can be called when a controller makes a new spectrum:
 
     
+    @pyqtSlot(str)
     def spectrum_added(self, name):
         self.new_spectrum.emit(name)
 
     # Slot to call when a spectrum was deleted.
+    @pyqtSlot(str)
     def spectrum_removed(self, name):
         self.spectrum_deleted.emit(name)
 
     def load_editor(self, row):
         #  Get the editor that corresponds to the type (index 1)
         stype = row[1]
+        filler = self._fillers.get(stype)
+        if filler is None:
+            error(f'Unable to load spectrum type: {stype} unsupported type')
+            return                      # don't set the index on error.
         (view, index) = self._geteditorwidget(stype)
         if view is None:
             return
-        #  Note that our buster Python 3 is < 3.10 which means
-        #  that match is not supported:
-        
-        if stype == '1':
-                self._fill1d(row, view)
-        elif stype == '2':
-                self._fill2d(row, view)
-        elif stype == 's':
-                self._fillsummary(row, view)
-        elif stype == 'g1':
-                self._fillgamma1(row, view)
-        elif stype == 'g2':
-                self._fillgamma2(row, view)
-        elif stype == 'gd':
-                self._fillpgamma(row, view)
-        elif stype == 'm2':
-                self._fill2dsum(row, view)
-        elif stype == 'S':
-                self._fillstripchart(row, view)
-        elif stype == 'b':
-                self._fillbitmask(row, view)
-        elif stype == 'gs':
-                self._fillgsummary(row, view)
-        else:                
-
-
-                error(f'Unable to load spectrum type: {stype} unsupported type')
-                return                      # don't set the index on error.
+        filler(row, view)
         self.tabs.setCurrentIndex(index)
 
     #  Utilities:
@@ -1099,74 +1283,70 @@ class Editor(QWidget):
         # Given a description type, 
         # return the view widget of the editor:
 
-        if stype not in _type_strings.keys():
-            return None
-        tab_label = _type_strings[stype]   # Tab label.
-        if tab_label not in self.tab_indices.keys():
-            return None
-        tab_index = self.tab_indices[tab_label]
-        return (self.tabs.widget(tab_index), tab_index)
+        tab_label = _type_strings.get(stype)   # Tab label.
+        tab_index = self.tab_indices.get(tab_label)
+        if tab_index is None:
+            return (None, None)
+        if tab_label in self._pending:
+            self._build_editor(tab_label)
+        return (self.editors[tab_label], tab_index)
+    def _build_editor(self, label):
+        # Build the editor and controller for the tab with label
+        # and put the editor in that tab's page.
+
+        ((module_name, class_name), controller_cls) = self._pending.pop(label)
+        editor_cls = getattr(import_module(module_name), class_name)
+        editor = editor_cls(self)  # So we can get this in the editors.
+        self.tabs.widget(self.tab_indices[label]).layout().addWidget(editor)
+        self.editors[label] = editor
+        controller = controller_cls(self, editor) # hook in controller.
+        self.controllers[label] = controller
+        index = self.tab_indices[label]
+        self._controllers_by_index[index] = controller
+        if type(controller).visible is AbstractController.visible:
+            self._on_visible[index] = _noop
+        else:
+            self._on_visible[index] = controller.visible
+        return editor
     def _fill1d(self, sdef, view):
         view.setName(sdef[0])
         view.setParameter(sdef[2])
-        view.setLow(sdef[3])
-        view.setHigh(sdef[4])
-        view.setHigh(sdef[5])
-        # on success make that the current tab:
+        view.setAxis(sdef[3], sdef[4], sdef[5])
         
     def _fill2d(self, sdef, view):
         view.setName(sdef[0])
         
         view.setXparameter(sdef[2])
-        view.setXLow(sdef[3])
-        view.setXHigh(sdef[4])
-        view.setXBins(sdef[5])
+        view.setXAxis(sdef[3], sdef[4], sdef[5])
 
         view.setYparameter(sdef[6])
-        view.setYLow(sdef[7])
-        view.setYHigh(sdef[8])
-        view.setYBins(sdef[9])
+        view.setYAxis(sdef[7], sdef[8], sdef[9])
 
         
 
     def _fillsummary(self, sdef, view):
         view.setName(sdef[0])
         view.setAxis_parameters(sdef[2].split(','))
-        view.setLow(sdef[7])
-        view.setHigh(sdef[8])
-        view.setBins(sdef[9])
+        view.setAxis(sdef[7], sdef[8], sdef[9])
 
     def _fillgamma1(self, sdef, view):
         view.setName(sdef[0])
         view.setAxis_parameters(sdef[2].split(','))
-        view.setLow(sdef[3])
-        view.setHigh(sdef[4])
-        view.setBins(sdef[5])
+        view.setAxis(sdef[3], sdef[4], sdef[5])
         
     def _fillgamma2(self, sdef, view):
         view.setName(sdef[0])
         view.setAxis_parameters(sdef[2].split(','))
 
-        view.setXlow(sdef[3])
-        view.setXhigh(sdef[4])
-        view.setXbins(sdef[5])
         #  6 are the y parameters which are empty.
-        view.setYlow(sdef[7])
-        view.setYhigh(sdef[8])
-        view.setYbins(sdef[9])
+        view.setAxes(sdef[3], sdef[4], sdef[5], sdef[7], sdef[8], sdef[9])
 
     def _fillpgamma(self, sdef, view):
         view.setName(sdef[0])
 
         view.setXparameters(sdef[2].split(','))
-        view.setXlow(sdef[3])
-        view.setXhigh(sdef[4])
-        view.setXbins(sdef[5])
-
         view.setYparameters(sdef[6].split(','))
-        view.setYlow(sdef[7])
-        view.setYhigh(sdef[8])
-        view.setYbins(sdef[9])
+        view.setAxes(sdef[3], sdef[4], sdef[5], sdef[7], sdef[8], sdef[9])
     
     def _fill2dsum(self, sdef, view):
         #  Keep distinct in case at some point the editor is split off.
@@ -1177,9 +1357,7 @@ class Editor(QWidget):
         view.setXparam(sdef[2])
         view.setYparam(sdef[6])
 
-        view.setLow(sdef[3])
-        view.setHigh(sdef[4])
-        view.setBins(sdef[5])
+        view.setAxis(sdef[3], sdef[4], sdef[5])
     def _fillbitmask(self, sdef, view):
         view.setName(sdef[0])
         view.setParameter(sdef[2])
@@ -1193,15 +1371,12 @@ class Editor(QWidget):
         
         view.clear()                   # Get rid of all channels but 0.
         params = sdef[2].split(',')    #  List of space separated params:
+        for _ in range(view.xchannels(), len(params)):  # Chan 0 is predefined.
+            view.addChannel()          # Add the tabs we need.
         for (i, channel) in enumerate(params):
-            print(i, view.xchannels())
-            if i >= view.xchannels():   # Need this because of predefined chan 0.
-                view.addChannel()      # If needed add a tab.
             view.loadChannel(i, channel.split(' '))
 
-        view.setLow(sdef[3])           # X axis.
-        view.setHigh(sdef[4])
-        view.setBins(sdef[5])
+        view.setAxis(sdef[3], sdef[4], sdef[5])           # X axis.
 
         
 # --- tests
@@ -1,5 +1,5 @@
 '''
-    This file contains code to make a standard item model to hold tree variables.
+    This file contains code to make a table model to hold tree variables.
     Each tree variable has the following simple 'textual' fields:
     
     name - the name of the variable.
@@ -9,32 +9,75 @@
     We also provide a load method to fill the model given a client.
 '''
 
-from PyQt5.QtGui import QStandardItemModel, QStandardItem, QDoubleValidator
-from PyQt5.QtCore import Qt, pyqtSignal
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from PyQt5.QtGui import QDoubleValidator
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
 from PyQt5.QtWidgets import (
-    QComboBox, QWidget, QPushButton, QCheckBox, QTableWidget, QAbstractItemView,
-    QLabel, QLineEdit,
+    QComboBox, QWidget, QPushButton, QCheckBox, QTableView, QAbstractItemView,
+    QLineEdit, QStyledItemDelegate,
     QHBoxLayout, QVBoxLayout
 )
 
 
-class TreeVariableModel(QStandardItemModel):
-    _colheadeings = ['Name', 'Value', 'Units']
+class TreeVariableModel(QAbstractTableModel):
+    _colheadings = ('Name', 'Value', 'Units')
     def __init__(self, *args):
         super().__init__(*args)
-    def headerData(self, col, orient, role):
-        if role == Qt.DisplayRole:
-            if orient == Qt.Horizontal:
-                return self._colheadings[col]
-            else:
-                return None
+        
+        # The variables are kept in parallel lists with values as floats.
+        
+        self._names  = list()
+        self._values = list()
+        self._units  = list()
+        self._rows_by_name = dict()
+        
+        # Name matching is case blind (as Qt wildcard matching was), so
+        # (lower cased name, row) pairs are kept sorted for the lookups.
+        
+        self._folded_rows = list()
+    def headerData(self, col, orient, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orient != Qt.Horizontal:
+            return None
+        return self._colheadings[col]
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._colheadings)
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole and role != Qt.EditRole:
+            return None
+        row = index.row()
+        col = index.column()
+        if col == 0:
+            return self._names[row]
+        elif col == 1:
+            return str(self._values[row])
+        else:
+            return self._units[row]
     # Public methods
                 
+    def clear(self):
+        self.beginResetModel()
+        self._clear()
+        self.endResetModel()
     def load(self, client):
         raw_data = client.treevariable_list()
-        self.clear()             # Get rid of prior data.
-        for var in raw_data['detail']:
-            self._add_line(var)
+        
+        # Views are told the model was reset once it's refilled.
+        
+        variables = raw_data['detail']
+        self.beginResetModel()
+        self._names  = [var['name'] for var in variables]
+        self._values = [float(var['value']) for var in variables]
+        self._units  = [var['units'] for var in variables]
+        self._rows_by_name = {name: row for row, name in enumerate(self._names)}
+        self._folded_rows = sorted((name.lower(), row) for row, name in enumerate(self._names))
+        self.endResetModel()
     
     def get_definition(self, name):
         ''' 
@@ -45,49 +88,80 @@ class TreeVariableModel(QStandardItemModel):
         'units'  - Units of the item.
         
         '''
-        matches = self.findItems(name, Qt.MatchExactly, 0)   # only match name field.
-        if len(matches) == 1:
-            return self._name_item_to_def(matches[0])
+        row = self._rows_by_name.get(name)
+        if row is not None:
+            return self._row_to_def(row)
         else:
-            return None     # We don't know how to handle multiple matches.
+            return None
     def get_matching_definitions(self, pattern):
-        matches = self.findItems(pattern, Qt.MatchWildcard, 0)
-        result = list()
-        for match in matches:
-            result.append(self._name_item_to_def(match))
-        return result
+        '''
+        Returns the definitions of the variables whose names match the
+        glob pattern ignoring case.  Literal names and prefix.* patterns
+        are looked up directly; anything else is matched against every name.
+        '''
+        if not _has_glob(pattern):
+            return self._folded_matches(pattern.lower(), str.__eq__)
+        if pattern.endswith('.*') and not _has_glob(pattern[:-2]):
+            return self.get_definitions_under(pattern[:-2])
+        pattern = pattern.lower()
+        return [
+            self._row_to_def(row) for row, name in enumerate(self._names)
+            if fnmatchcase(name.lower(), pattern)
+        ]
+    def get_definitions_under(self, prefix):
+        '''
+        Returns the definitions of the variables whose names start with
+        prefix followed by a '.', ignoring case.  This is what
+        get_matching_definitions returns for the pattern prefix.* but
+        without looking at every variable.
+        '''
+        return self._folded_matches(prefix.lower() + '.', str.startswith)
     def set_definition(self, definition):
-        matches = self.findItems(definition['name'], Qt.MatchExactly, 0)
-        if len(matches)  ==1:
-            index = self.indexFromItem(matches[0])
-            row   = index.row()
-            self.item(row,1).setText(str(definition['value']))
-            self.item(row,2).setText(definition['units'])
+        self.set_definitions([definition])
+    def set_definitions(self, definitions):
+        ''' 
+        Update the values and units of the variables in the iterable
+        'definitions'.  Views are told with one dataChanged.  Definitions
+        of unknown variables are ignored.
+        '''
+        rows = list()
+        for definition in definitions:
+            row = self._rows_by_name.get(definition['name'])
+            if row is not None:
+                self._values[row] = float(definition['value'])
+                self._units[row] = definition['units']
+                rows.append(row)
+        if len(rows) > 0:
+            self.dataChanged.emit(self.index(min(rows), 1), self.index(max(rows), 2))
             
     # Private methods:
     
-    def _add_line(self, var):
-        name = var['name']
-        value= var['value']
-        strvalue = f'{value}'
-        units= var['units']
-        
-        self.appendRow([
-            QStandardItem(name), QStandardItem(strvalue), QStandardItem(units)
-        ])
-    def _name_item_to_def(self, item):
-        index = self.indexFromItem(item)
-        row   = index.row()
-        name  = self.item(row, 0).text()
-        valueItem = self.item(row, 1)
-        unitsItem = self.item(row, 2)
-        value = float(valueItem.text().replace(',',''))
-        units = unitsItem.text()
-        
+    def _clear(self):
+        self._names.clear()
+        self._values.clear()
+        self._units.clear()
+        self._rows_by_name.clear()
+        self._folded_rows.clear()
+    def _folded_matches(self, folded, matches):
+        # Definitions of the variables whose lower cased names satisfy
+        # matches(name, folded); those must sort together from folded on.
+        
+        rows = self._folded_rows
+        result = list()
+        for i in range(bisect_left(rows, (folded,)), len(rows)):
+            name, row = rows[i]
+            if not matches(name, folded):
+                break
+            result.append(self._row_to_def(row))
+        return result
+    def _row_to_def(self, row):
         return {
-            'name': name, 'value': value, 'units': units
+            'name': self._names[row], 'value': self._values[row], 'units': self._units[row]
         }
         
+def _has_glob(pattern):
+    return '*' in pattern or '?' in pattern or '[' in pattern
+
 common_treevariable_model = TreeVariableModel()
 # Now some views:
 
@@ -171,13 +245,26 @@ class VariableSelector(QWidget):
         self._remove.clicked.connect(self.remove)
         self._load.clicked.connect(self.load)
         self._set.clicked.connect(self.set)
+        
+        # The selected definition is remembered until the selection or
+        # the model's contents change:
+        
+        self._definition = None
+        model = self._chooser.model()
+        self._chooser.currentIndexChanged.connect(self._forget_definition)
+        model.dataChanged.connect(self._forget_definition)
+        model.modelReset.connect(self._forget_definition)
     # Implement attributes:
     
     def name(self):
         return self._chooser.currentText()
     def definition(self):
-        name = self._chooser.currentText()
-        return self._chooser.model().get_definition(name)
+        if self._definition is None:
+            name = self._chooser.currentText()
+            self._definition = self._chooser.model().get_definition(name)
+        if self._definition is None:
+            return None
+        return dict(self._definition)      # Callers may modify it.
     def array(self):
         return self._array.checkState() == Qt.Checked
     def setArray(self, value):
@@ -187,38 +274,156 @@ class VariableSelector(QWidget):
             newstate = Qt.Unchecked
         self._array.setCheckState(newstate)
     
+    # Private slots:
+    
+    def _forget_definition(self, *args):
+        self._definition = None
+    
+
+class VariableTableModel(QAbstractTableModel):
+    '''
+    Model behind the VariableTable.  The names, values and units are kept in
+    parallel lists; values are kept as floats.  Name cells are read-only,
+    value and units cells can be edited.
+    '''
+    _headings = ('Name', 'Value', 'Units')
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._names = list()
+        self._values = list()
+        self._units = list()
+    
+    # QAbstractTableModel overrides:
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._headings)
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole and role != Qt.EditRole:
+            return None
+        row = index.row()
+        col = index.column()
+        if col == 0:
+            return self._names[row]
+        elif col == 1:
+            return str(self._values[row])
+        else:
+            return self._units[row]
+    def headerData(self, section, orient, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orient == Qt.Horizontal:
+            return self._headings[section]
+        return super().headerData(section, orient, role)
+    def flags(self, index):
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if index.column() > 0:
+            flags |= Qt.ItemIsEditable
+        return flags
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole:
+            return False
+        row = index.row()
+        col = index.column()
+        if col == 1:
+            try:
+                self._values[row] = float(str(value).replace(',', ''))
+            except ValueError:
+                return False
+        elif col == 2:
+            self._units[row] = value
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+    
+    # Methods used by the VariableTable:
+    
+    def clear(self):
+        self.beginResetModel()
+        self._names.clear()
+        self._values.clear()
+        self._units.clear()
+        self.endResetModel()
+    def append(self, definition):
+        row = len(self._names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._names.append(definition['name'])
+        self._values.append(float(definition['value']))
+        self._units.append(definition['units'])
+        self.endInsertRows()
+    def replace(self, replacements):
+        # replacements is a list of (row, definition) pairs.  Views are
+        # told about all of them with one dataChanged.
+        if len(replacements) == 0:
+            return
+        for row, definition in replacements:
+            self._names[row] = definition['name']
+            self._values[row] = float(definition['value'])
+            self._units[row] = definition['units']
+        rows = [row for row, _ in replacements]
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 2))
+    def remove(self, first, last):
+        # Remove rows first through last inclusive.
+        self.beginRemoveRows(QModelIndex(), first, last)
+        del self._names[first:last+1]
+        del self._values[first:last+1]
+        del self._units[first:last+1]
+        self.endRemoveRows()
+    def definition(self, row):
+        return {
+            'name': self._names[row], 'value': self._values[row], 'units': self._units[row]
+        }
+
+class _ValueDelegate(QStyledItemDelegate):
+    # Edits values with a line edit that only accepts floating point numbers.
+    # The editor only exists while a cell is being edited; all editors share
+    # one validator.
     
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._validator = QDoubleValidator(self)
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        editor.setValidator(self._validator)
+        return editor
 
-class VariableTable(QTableWidget):
+class VariableTable(QTableView):
     '''
     This is a table for tree variables each row has a name, value and units column.
+    The data live in a VariableTableModel.
     Methods:
        clear - Remove all rows from the table.
        append - Append a row.
        replace - Replace an existing row.
+       replace_rows - Replace several existing rows.
        remove  - Remove an existing row.
+       remove_rows - Remove several existing rows.
        selection - Return the currently selected rows.
     '''
     def __init__(self, *args):
         super().__init__(*args)
-        self.setColumnCount(3)
-        self.setHorizontalHeaderLabels(['Name', 'Value', 'Units'])
-        self.showGrid()
+        self._model = VariableTableModel(self)
+        self.setModel(self._model)
+        self.setItemDelegateForColumn(1, _ValueDelegate(self))
+        self.setShowGrid(True)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
     
     # Public methods:
     def clear(self):
         ''' Clear all table rows.'''
-        while self.rowCount() > 0:
-            self.remove(0)
+        self._model.clear()
     def append(self, definition):
         ''' 
             Appends a new row to the table.  definition is a definition of a tree variable
             that may have come from the model's get_definition  method.
         '''
         
-        self._append_row(definition)
+        self._model.append(definition)
     
     def replace(self, row, definition):
         ''' 
@@ -227,18 +432,44 @@ class VariableTable(QTableWidget):
         '''
 
         self._check_row(row)
-        row_items = self._make_row(definition)
-        col = 0
-        for item in row_items:
-            self.setCellWidget(row, col, item)
-            col += 1
+        self._model.replace([(row, definition)])
+    
+    def replace_rows(self, replacements):
+        '''
+        Replace several rows at once.  'replacements' is an iterable of
+        (row, definition) pairs.  If any row is out of range raises index
+        error and nothing is replaced.
+        '''
+        replacements = list(replacements)
+        for row, _ in replacements:
+            self._check_row(row)
+        self._model.replace(replacements)
     
     def remove(self, row):
         '''
         Remove row number 'row' from the table.  Again if row is out of range raises index error
         '''
         self._check_row(row)
-        self.removeRow(row)
+        self._model.remove(row, row)
+    
+    def remove_rows(self, rows):
+        '''
+        Remove the rows whose numbers are in the iterable 'rows'.  Runs of
+        adjacent rows are removed together.  If any row is out of range
+        raises index error and nothing is removed.
+        '''
+        rows = sorted(set(rows), reverse=True)
+        if len(rows) > 0:
+            self._check_row(rows[0])    # Largest row is the only one to check.
+        i = 0
+        while i < len(rows):
+            last = rows[i]
+            first = last
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            self._model.remove(first, last)
     
     def selection(self):
         '''
@@ -250,44 +481,17 @@ class VariableTable(QTableWidget):
         'row'    - Row number in the table.
         '''
         
-        
-        selected_rows = self._selected_rows()
-        result = list()
-        for row in selected_rows:
-            name = self.cellWidget(row, 0).text()
-            value = float(self.cellWidget(row,1).text().replace(',',''))
-            units = self.cellWidget(row, 2).text()
-            result.append({
-                'name': name, 'value': value, 'units': units, 'row' : row
-            })
-        return result
+        model = self._model
+        return [dict(model.definition(row), row=row) for row in self._selected_rows()]
         
         
     #   Utilities (private):
     def _selected_rows(self):
-        ranges=  self.selectedRanges()
-        rows = list()
-        for r in ranges:
-            bottom = r.bottomRow()
-            top    = r.topRow()
-            for row in range(top, bottom+1):
-                rows.append(row)
-        return rows
-        
-    def _append_row(self, definition):
-        oldcount =self.rowCount()
-        self.setRowCount(oldcount + 1)
-        self.replace(oldcount, definition)
+        return sorted(index.row() for index in self.selectionModel().selectedRows())
     
     def _check_row(self, row):
-        if row > self.rowCount() - 1:
+        if row > self._model.rowCount() - 1:
             raise IndexError(f"No such row in VariableTable {row}")
-    def _make_row(self, definition):
-        name = QLabel(definition['name'], self)
-        value = QLineEdit(str(definition['value']) ,self) 
-        value.setValidator(QDoubleValidator(self))
-        units = QLineEdit(definition['units'], self)
-        return [name, value, units]
 
 
 class TreeVariableView(QWidget):
@@ -354,14 +558,6 @@ if __name__ == '__main__':
     from rustogramer_client import rustogramer as rcl
     from PyQt5.QtWidgets import (QApplication, QMainWindow)
     
-    def _find_def(name, data):
-        # Find the matching definition in data.
-        
-        for item in data:
-            if name == item['name']:
-                return item
-        return None
-    
     def selected():
         return  wid.selector().definition()
     def append():
@@ -374,26 +570,28 @@ if __name__ == '__main__':
         selected()
     def remove():
         sel = wid.table().selection()
-        rows = [x['row'] for x in sel]
-        rows.sort(reverse=True)
-        for row in rows:
-            wid.table().remove(row)
+        wid.table().remove_rows([x['row'] for x in sel])
     def load():
         print('load', wid.selector().array())
-        selection = wid.table().selection()
+        table = wid.table()
+        selection = table.selection()
         data = client.treevariable_list()['detail']    # Load current data from server.
+        by_name = {d['name']: d for d in data}
+        replacements = list()
         for item in selection:
-            name = item['name']
-            info = _find_def(name, data)
+            info = by_name.get(item['name'])
             if info is not None:
-                wid.table().replace(item['row'], info)
+                replacements.append((item['row'], info))
+        table.replace_rows(replacements)
             
     def setvalue(): 
         print('set', wid.selector().array())   # We don't respect that....
         selection = wid.table().selection()
+        treevariable_set = client.treevariable_set
+        set_definition = common_treevariable_model.set_definition
         for var in selection:
-            client.treevariable_set(var['name'], var['value'], var['units'])
-            common_treevariable_model.set_definition(var) # update the model.
+            treevariable_set(var['name'], var['value'], var['units'])
+            set_definition(var) # update the model.
     
     client = rcl({'host':'localhost', 'port': 8000})
     common_treevariable_model.load(client)
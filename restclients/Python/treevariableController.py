@@ -2,8 +2,7 @@
 This model contains a class that acts as the controller for the treevariable view.
 '''
 from treevariable import (common_treevariable_model)
-from spectrumeditor import error
-import fnmatch
+from spectrumeditor import error, run_async
 
 
 class TreeVariableController:
@@ -16,15 +15,22 @@ class TreeVariableController:
         This class has no public methods.  Once the event loop is running,
         it is fully autonomous.
     '''
-    def __init__(self, view, client):
+    # __weakref__ is kept: PyQt holds slots that are bound methods by weak
+    # reference to their object.
+    
+    __slots__ = ('_view', '_client', '_set_workers', '_selector', '_table', '__weakref__')
+    def __init__(self, view, client, set_workers=None):
         '''
            view - the TreeVariableView object we're the controller form.
            client - The client object (rustogramer_client.rustogramer) that we use
               to communicate with the model (server).'
+           set_workers - How many variables are set at once; 1 sets them one
+              at a time in order.  None uses the client's set_workers.
             
         '''
         self._view = view
         self._client = client
+        self._set_workers = set_workers
         
         # Let's also cache the view's components to save some time:
         
@@ -38,53 +44,76 @@ class TreeVariableController:
         view.set.connect(self._set)
     
     def _append(self):
+        selected = self._selected()
+        if selected is None:
+            return                     # No variable chosen.
         if self._selector.array():
-            element = self._selected()['name']
-            path =  element.split('.')
-            array = path[0:-1]
+            array = selected['name'].rpartition('.')[0]
             if len(array) > 0:
-                pattern = '.'.join(array) + '.*'
+                prefix = array + '.'      # What the array's elements start with.
                 for variable in self._client.treevariable_list()['detail']:
-                    if fnmatch.fnmatch(variable['name'], pattern):
+                    if variable['name'].startswith(prefix):
                         self._table.append(variable)
         else:
-            self._table.append(self._selected())
+            self._table.append(selected)
     def _replace(self):
         selection = self._table.selection()
         if len(selection) == 1:
-            row = selection[0]['row']
-            self._table.replace(row, self._selected())
+            selected = self._selected()
+            if selected is not None:
+                self._table.replace(selection[0]['row'], selected)
     def _remove(self):
         sel = self._table.selection()
-        rows = [x['row'] for x in sel]
-        rows.sort(reverse=True)
-        for row in rows:
-            self._table.remove(row)
+        if len(sel) > 0:
+            self._table.remove_rows([x['row'] for x in sel])
     def _load(self):
         selection = self._table.selection()
+        if len(selection) == 0:
+            return                     # Don't bother the server.
         data = self._client.treevariable_list()['detail']    # Load current data from server.
+        by_name = {d['name']: d for d in data}
+        replacements = list()
         for item in selection:
-            name = item['name']
-            info = self._find_def(name, data)
-            if info is not None:
-                self._table.replace(item['row'], info)
+            info = by_name.get(item['name'])
+            if info is not None and self._differs(item, info):
+                replacements.append((item['row'], info))
+        self._table.replace_rows(replacements)
     def _set(self):
-        data = self._get_vars_to_set()
-        for var in data:
-            self._client.treevariable_set(var['name'], var['value'], var['units'])
-            common_treevariable_model.set_definition(var)
+        # The sets are done in the thread pool so the GUI stays live while
+        # they happen; the model is updated once they're done.
+        
+        selection = self._table.selection()
+        if len(selection) == 0:
+            return
+        data = self._get_vars_to_set(selection)
+        if len(data) == 0:
+            return                     # Nothing consistent to set.
+        def done(results):
+            failures = [
+                f"{var['name']}: {e}" for var, e in zip(data, results) if e is not None
+            ]
+            common_treevariable_model.set_definitions(
+                var for var, e in zip(data, results) if e is None
+            )
+            if len(failures) > 0:
+                error(f'Unable to set {len(failures)} tree variables', failures)
+        def failed(e):
+            error(f'Unable to set tree variables: {e}')
+        run_async(
+            self._client.treevariable_set_list, data, self._set_workers,
+            on_ok=done, on_err=failed
+        )
     
     # Utiltities:
     
     def _selected(self):
         return  self._selector.definition()
-    def _find_def(self, name, data):
-        for item in data:
-            if name == item['name']:
-                return item
-        return None
-    def _get_vars_to_set(self):
-        # Figure out which variables to set and to which values.
+    def _differs(self, row, definition):
+        # True if the table row does not already show definition.
+        return float(definition['value']) != row['value'] or definition['units'] != row['units']
+    def _get_vars_to_set(self, selected):
+        # Figure out which variables to set and to which values from the
+        # table selection, selected.
         # This is slightly complicated if array is checked:
         #  - it is possible that there's more than one selected item that
         #    that matches the array pattern.
@@ -92,11 +121,6 @@ class TreeVariableController:
         #    this is noted and an error popup will be done noting that this variable array will
         #    not be set.
     
-        result = list()
-        
-        #  First get the selection list.
-        
-        selected = self._table.selection()
         if self._selector.array():
             selected = self._apply_array(selected)
         result = self._resolve_duplicates(selected)
@@ -107,55 +131,49 @@ class TreeVariableController:
         return result
     def _apply_array(self, selection):
         # Given that the names should be turned into patterns, apply
-        # return a new list of settings to make which have the arry check applied:
+        # generate the settings to make which have the arry check applied.
+        # _resolve_duplicates is what makes the list.
         
-        result = list()
+        # Several selected elements of one array share the lookup.
+        
+        definitions_under = common_treevariable_model.get_definitions_under
+        arrays = dict()
         for var in selection:
-            name = var['name']
-            pattern_list = name.split('.')
-            pattern = '.'.join(pattern_list[0:-1]) + '.*'
-            matches = common_treevariable_model.get_matching_definitions(pattern)
+            array = var['name'].rpartition('.')[0]
+            matches = arrays.get(array)
+            if matches is None:
+                matches = arrays[array] = definitions_under(array)
+            # All units and values for any single match shoulid come from the base item.
+            value, units = var['value'], var['units']
             for match in matches:
-                # All units and values for any single match shoulid come from the base item.
-                result.append({
-                    'name':match['name'], 'value':var['value'], 'units':var['units']
-                })
-        return result
+                yield {'name':match['name'], 'value':value, 'units':units}
     def _resolve_duplicates(self, defs):
         # Given a set of definitions resolve the potential duplicates:
         # If there are duplicates with the same value/unit pairs Simple
         # Get rid of the 'second'.  If there is a mismatch in value/units,
-        # Mark that to be the case and get rid of the second.
+        # the name is bad and none of its settings are made.
         # Once all this is done, indicate the set of duplicates in a popup error.
-        # That lists the 'bad' duplciates.  The good values are returned.
-        # This is all done by consdtructing a dict indexed on name
-        # values are the definition with the added 'ok' field that is ok if there're no
-        # inconsistent duplicates.
+        # That lists the 'bad' duplciates.  The good values are returned
+        # in the order they first appear.
+        # seen is indexed on name and holds the first definition and its
+        # (value, units) pair; the caller's dicts are not modified.
         
-        dupcatcher = dict()
+        seen = dict()
+        bad = set()
         for info in defs:
             name = info['name']
-            if  name  not in dupcatcher.keys():
-                # First (only?) time:
-                
-                dupcatcher[name] = info
-                dupcatcher[name]['ok'] = True
-            else:
-                # is this version consistent? If so just don't add, otherwise,
-                # set the 'ok' value to False.
-                
-                if info['value'] != dupcatcher[name]['value'] or info['units'] != dupcatcher[name]['units']:
-                    dupcatcher[name]['ok'] = False
-        
-        # Bad names:
+            setting = (info['value'], info['units'])
+            first = seen.get(name)
+            if first is None:
+                seen[name] = (info, setting)
+            elif first[1] != setting:
+                bad.add(name)
         
-        bad_names = [dupcatcher[x]['name'] for x in dupcatcher.keys() if not dupcatcher[x]['ok']]
-        if len(bad_names) > 0:
+        if len(bad) > 0:
+            bad_names = [x for x in seen if x in bad]
             error(f"The following settings are inconsistent in value and/or units and won't be altered {bad_names}")
             
-        result = [dupcatcher[x] for x in dupcatcher.keys() if dupcatcher[x]['ok']]
-        
-        return result
+        return [info for name, (info, setting) in seen.items() if name not in bad]
 
 #----------------------------------------------------------------------------
 # Test code: